@@ -50,7 +50,8 @@ jmp_buf ubo_error_jmp;
 int ubo_error_jmp_valid = 0;
 
 // Filled by i_video_ubo.c via extern.
-uint8_t ubo_rgba[320 * 200 * 4];
+// 16-byte aligned so the service can view it as one uint32 word per pixel.
+uint8_t ubo_rgba[320 * 200 * 4] __attribute__((aligned(16)));
 
 static int g_inited = 0;  // 0=not started, 1=ok, -1=failed
 
@@ -84,6 +85,10 @@ static char* g_argv[16];
 static int g_argc = 0;
 static char g_prog[] = "ubodoom";
 
+// Per-key debug logging on stderr, enabled with UBO_DOOM_VERBOSE=1 (read once
+// in doom_init).  Off by default: key events are on the input hot path.
+static int g_verbose = 0;
+
 static int map_ubo_key(ubo_key_t key)
 {
     switch (key)
@@ -113,6 +118,10 @@ int doom_init(const char* iwad_path)
 
     launch_cwd = getenv("UBO_DOOM_CWD");
     config_path = getenv("UBO_DOOM_CONFIG");
+    {
+        const char* verbose = getenv("UBO_DOOM_VERBOSE");
+        g_verbose = verbose && verbose[0] != '\0' && verbose[0] != '0';
+    }
 
     if (launch_cwd && launch_cwd[0] != '\0') {
         if (chdir(launch_cwd) != 0) {
@@ -216,9 +225,9 @@ int doom_init(const char* iwad_path)
     return 0;
 }
 
-void doom_tick(void)
+int doom_tick(void)
 {
-    if (g_inited != 1) return;
+    if (g_inited != 1) return 0;
 
     // Arm the crash jump so SIGSEGV/SIGBUS and I_Error during the tick are
     // caught here rather than killing the host process (ubo_app).
@@ -231,7 +240,7 @@ void doom_tick(void)
         ubo_error_jmp_valid = 0;
         g_inited = -1;
         fprintf(stderr, "[doom] doom_tick aborted via signal (SIGSEGV/SIGBUS)\n");
-        return;
+        return 0;
     }
 
     if (setjmp(ubo_error_jmp) != 0) {
@@ -240,7 +249,7 @@ void doom_tick(void)
         ubo_error_jmp_valid = 0;
         g_inited = -1;
         fprintf(stderr, "[doom] doom_tick aborted via I_Error\n");
-        return;
+        return 0;
     }
 
     // One "outer loop" iteration of D_DoomLoop(), singletics path.
@@ -286,6 +295,7 @@ void doom_tick(void)
 
     g_crash_jmp_valid = 0;
     ubo_error_jmp_valid = 0;
+    return 1;
 }
 
 void doom_shutdown(void)
@@ -301,7 +311,8 @@ void doom_key_down(ubo_key_t key)
 {
     int doom_key = map_ubo_key(key);
     event_t ev;
-    fprintf(stderr, "[doom] key_down ubo=%d doom=0x%02x\n", (int)key, doom_key);
+    if (g_verbose)
+        fprintf(stderr, "[doom] key_down ubo=%d doom=0x%02x\n", (int)key, doom_key);
     ev.type = ev_keydown;
     ev.data1 = doom_key;
     ev.data2 = 0;
@@ -313,7 +324,8 @@ void doom_key_up(ubo_key_t key)
 {
     int doom_key = map_ubo_key(key);
     event_t ev;
-    fprintf(stderr, "[doom] key_up   ubo=%d doom=0x%02x\n", (int)key, doom_key);
+    if (g_verbose)
+        fprintf(stderr, "[doom] key_up   ubo=%d doom=0x%02x\n", (int)key, doom_key);
     ev.type = ev_keyup;
     ev.data1 = doom_key;
     ev.data2 = 0;
@@ -321,6 +333,21 @@ void doom_key_up(ubo_key_t key)
     D_PostEvent(&ev);
 }
 
+int doom_post_keys(const int* events, int n)
+{
+    int i;
+    if (!events || n < 0) return -1;
+    for (i = 0; i < n; i++) {
+        if (events[i] > 0)
+            doom_key_down((ubo_key_t)events[i]);
+        else if (events[i] < 0)
+            doom_key_up((ubo_key_t)-events[i]);
+    }
+    return 0;
+}
+
+int doom_api_version(void) { return UBO_DOOM_API_VERSION; }
+
 const uint8_t* doom_get_rgba_ptr(void) { return ubo_rgba; }
 int doom_get_rgba_width(void) { return 320; }
 int doom_get_rgba_height(void) { return 200; }
@@ -13,9 +13,18 @@ extern int ubo_library_mode;
 // Framebuffer produced by i_video_ubo.c (320x200 RGBA8888)
 extern uint8_t ubo_rgba[320 * 200 * 4];
 
+// ABI revision of this header.  Bumped whenever an existing export changes
+// signature or a new export becomes required; the Python wrapper checks it
+// once at load and refuses a library built from a different revision.
+//   1: doom_tick returns int (alive flag); doom_post_keys; doom_get_rgb565_be
+#define UBO_DOOM_API_VERSION 1
+int doom_api_version(void);
+
 // Minimal embedded API.
 int doom_init(const char* iwad_path);
-void doom_tick(void);
+// Runs one tic.  Returns 1 if the engine is still alive afterwards, 0 if it is
+// not initialised or died during this tic (same as a following doom_is_alive()).
+int doom_tick(void);
 void doom_shutdown(void);
 
 // Input (a tiny stable enum that we map to doomkeys.h internally).
@@ -33,11 +42,24 @@ typedef enum ubo_key_e {
 void doom_key_down(ubo_key_t key);
 void doom_key_up(ubo_key_t key);
 
+// Post n key events in order with one call: a positive value k is
+// doom_key_down(k), a negative value -k is doom_key_up(k), 0 is ignored.
+// Returns 0, or -1 if events is NULL or n is negative.
+int doom_post_keys(const int* events, int n);
+
 // Accessors for ctypes.
 const uint8_t* doom_get_rgba_ptr(void);
 int doom_get_rgba_width(void);
 int doom_get_rgba_height(void);
 
+// Scale screens[0] (nearest-neighbor) into out as RGB565 big-endian, letterboxed:
+// out holds out_w*out_h*2 bytes; pad_top black rows top and bottom, the image
+// fills the out_h - 2*pad_top rows in between.  The bars are cleared only the
+// first time a given out/out_w/out_h/pad_top is seen; callers must not write to
+// those rows between calls, or must pass a fresh buffer.  Returns 0 on success,
+// -1 on bad arguments or before the palette is loaded.
+int doom_get_rgb565_be(uint8_t* out, int out_w, int out_h, int pad_top);
+
 // Returns 1 if the engine is healthy, 0 otherwise (init failed or died mid-tick).
 int doom_is_alive(void);
 
@@ -13,10 +13,28 @@
 // Headless video backend:
 // - No X11, no input polling here.
 // - Converts Doom's 8-bit paletted screen (screens[0]) into a 320x200 RGBA8888 buffer (ubo_rgba).
+// - doom_get_rgb565_be() scales + packs screens[0] straight to the LCD format.
 
 static int g_inited = 0;
 static byte* g_palette = NULL;   // 256 * 3 RGB
 
+// Palette index -> RGB565 big-endian byte pair; rebuilt lazily after I_SetPalette.
+static uint8_t g_pal565[256][2];
+static int g_pal565_valid = 0;
+
+// Nearest-neighbor column map for doom_get_rgb565_be, cached per output width.
+#define UBO_MAX_OUT_W 1024
+static int g_xmap[UBO_MAX_OUT_W];
+static int g_xmap_w = 0;
+
+// Output buffer/geometry whose letterbox bars were last cleared.  The bars
+// are never written afterwards, so they are only cleared again when the
+// caller switches buffer or geometry.
+static uint8_t* g_bars_out = NULL;
+static int g_bars_w = 0;
+static int g_bars_h = 0;
+static int g_bars_pad = -1;
+
 void I_InitGraphics(void)
 {
     if (g_inited) return;
@@ -36,6 +54,7 @@ void I_SetPalette(byte* palette)
     // Doom will call this when palette changes (e.g., damage).
     // The argument points to 256*3 bytes.
     g_palette = palette;
+    g_pal565_valid = 0;
 }
 
 void I_UpdateNoBlit(void) { }
@@ -62,3 +81,61 @@ void I_FinishUpdate(void)
         dst[i*4 + 3] = 255;
     }
 }
+
+static void build_pal565(void)
+{
+    for (int i = 0; i < 256; i++)
+    {
+        const byte* rgb = g_palette + i * 3;
+        uint16_t v = (uint16_t)(((rgb[0] & 0xF8) << 8) | ((rgb[1] & 0xFC) << 3) | (rgb[2] >> 3));
+        g_pal565[i][0] = (uint8_t)(v >> 8);
+        g_pal565[i][1] = (uint8_t)(v & 0xFF);
+    }
+    g_pal565_valid = 1;
+}
+
+int doom_get_rgb565_be(uint8_t* out, int out_w, int out_h, int pad_top)
+{
+    int active_h = out_h - 2 * pad_top;
+
+    if (!out || out_w <= 0 || out_w > UBO_MAX_OUT_W || pad_top < 0 || active_h <= 0) return -1;
+    if (!g_inited) I_InitGraphics();
+    if (!g_palette) return -1;
+    if (!g_pal565_valid) build_pal565();
+
+    if (g_xmap_w != out_w)
+    {
+        for (int x = 0; x < out_w; x++)
+            g_xmap[x] = (x * SCREENWIDTH) / out_w;
+        g_xmap_w = out_w;
+    }
+
+    // Letterbox bars (top and bottom pad_top rows) are black: cleared once per
+    // buffer/geometry, not per frame.
+    const size_t row_bytes = (size_t)out_w * 2;
+    if (out != g_bars_out || out_w != g_bars_w || out_h != g_bars_h || pad_top != g_bars_pad)
+    {
+        memset(out, 0, row_bytes * pad_top);
+        memset(out + row_bytes * (pad_top + active_h), 0, row_bytes * pad_top);
+        g_bars_out = out;
+        g_bars_w = out_w;
+        g_bars_h = out_h;
+        g_bars_pad = pad_top;
+    }
+
+    // The source is 8-bit indexed, so one 256-entry table lookup per pixel
+    // replaces the RGBA gather + channel pack done on the Python side.
+    for (int y = 0; y < active_h; y++)
+    {
+        const byte* src = screens[0] + ((y * SCREENHEIGHT) / active_h) * SCREENWIDTH;
+        uint8_t* dst = out + row_bytes * (pad_top + y);
+
+        for (int x = 0; x < out_w; x++)
+        {
+            const uint8_t* px = g_pal565[src[g_xmap[x]]];
+            dst[2 * x + 0] = px[0];
+            dst[2 * x + 1] = px[1];
+        }
+    }
+    return 0;
+}
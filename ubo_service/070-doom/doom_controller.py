@@ -44,6 +44,34 @@ from native.doom_lib import UboKey
 # GS_LEVEL constant — keep in sync with doomstat.h
 GS_LEVEL: int = 0
 
+# Dispatch tables for the state-dependent buttons, indexed by
+# (in_level << 2) | (menu_active << 1) | alt_mode  — see DoomController._state.
+# Each entry is the (key, hold_ticks) tapped in that state.
+_BACK_TABLE: tuple[tuple[UboKey, int], ...] = (
+    (UboKey.ESCAPE, 2),       # title/demo
+    (UboKey.ESCAPE, 2),       # title/demo, alt
+    (UboKey.MENU_SELECT, 2),  # menu
+    (UboKey.MENU_SELECT, 2),  # menu, alt
+    (UboKey.FIRE, 2),         # in-level
+    (UboKey.FIRE, 2),         # in-level, alt
+    (UboKey.FIRE, 2),         # (in-level + menu cannot happen)
+    (UboKey.FIRE, 2),
+)
+_L2_TABLE: tuple[tuple[UboKey, int], ...] = (
+    (UboKey.LEFT, 12),
+    (UboKey.USE, 2),
+) * 4
+_L3_TABLE: tuple[tuple[UboKey, int], ...] = (
+    (UboKey.RIGHT, 12),       # title/demo
+    (UboKey.ESCAPE, 2),       # title/demo, alt
+    (UboKey.MENU_SELECT, 2),  # menu
+    (UboKey.ESCAPE, 2),       # menu, alt
+    (UboKey.RIGHT, 12),       # in-level
+    (UboKey.ESCAPE, 2),       # in-level, alt
+    (UboKey.MENU_SELECT, 2),
+    (UboKey.ESCAPE, 2),
+)
+
 
 class DoomController:
     """
@@ -144,32 +172,19 @@ class DoomController:
 
         Returns True always (Kivy handler return value meaning "event handled").
         """
-        if self._in_level:
-            self._tap(UboKey.FIRE)
-        elif self._menu_active:
-            self._tap(UboKey.MENU_SELECT)
-        else:
-            self._tap(UboKey.ESCAPE)
+        self._tap_fn(*_BACK_TABLE[self._state()])
         return True
 
     def btn_l2(self) -> None:
         """Normal: turn left.  ALT: use door/switch."""
-        if self._alt_mode:
-            self._tap(UboKey.USE)
-        else:
-            self._tap(UboKey.LEFT, hold_ticks=12)
+        self._tap_fn(*_L2_TABLE[self._state()])
 
     def btn_l3(self) -> None:
         """
         Normal: turn right (in-level) or confirm/select (in menu).
         ALT: open/close menu via ESCAPE.
         """
-        if self._alt_mode:
-            self._tap(UboKey.ESCAPE)
-        elif self._menu_active:
-            self._tap(UboKey.MENU_SELECT)
-        else:
-            self._tap(UboKey.RIGHT, hold_ticks=12)
+        self._tap_fn(*_L3_TABLE[self._state()])
 
     def toggle_mode(self) -> bool:
         """
@@ -199,9 +214,22 @@ class DoomController:
             return True
         return False
 
+    def reset(self) -> None:
+        """
+        Return to the freshly constructed state: not in a level, no menu,
+        Normal mode.  The tap_fn binding is kept.
+        """
+        self._in_level = False
+        self._menu_active = False
+        self._alt_mode = False
+
     # ------------------------------------------------------------------ #
     # Internal
     # ------------------------------------------------------------------ #
 
+    def _state(self) -> int:
+        """Index into the dispatch tables for the current (level, menu, alt) state."""
+        return (self._in_level << 2) | (self._menu_active << 1) | self._alt_mode
+
     def _tap(self, key: UboKey, hold_ticks: int = 2) -> None:
         self._tap_fn(key, hold_ticks)
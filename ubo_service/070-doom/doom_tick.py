@@ -0,0 +1,82 @@
+"""
+ubo_service/070-doom/doom_tick.py
+
+Pure helpers for the doom-tick thread: its scheduling priority, and draining
+and coalescing the key events queued by the Kivy main thread.  No Kivy, no .so,
+no ubo_app imports, so they can be unit-tested on their own.
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+from typing import Final
+
+from native.doom_lib import UboKey
+
+# Scheduling options for the doom-tick thread (UBO_DOOM_TICK_SCHED).
+TICK_SCHED_MODES: Final[tuple[str, ...]] = ("nice", "fifo", "off")
+TICK_FIFO_PRIORITY: Final[int] = 20
+TICK_NICE: Final[int] = -5
+
+# Movement keys that cancel each other: a newer tap in one direction replaces
+# any pending or held tap in the other.
+MOVEMENT_OPPOSITE: Final[dict[UboKey, UboKey]] = {
+    UboKey.UP: UboKey.DOWN,
+    UboKey.DOWN: UboKey.UP,
+}
+
+
+def drain_queue(q: queue.Queue[tuple[UboKey, int]]) -> list[tuple[UboKey, int]]:
+    """Take every pending item from *q* under a single lock acquisition."""
+    with q.mutex:
+        items = list(q.queue)
+        q.queue.clear()
+    return items
+
+
+def coalesce_taps(events: list[tuple[UboKey, int]]) -> list[tuple[UboKey, int]]:
+    """
+    Merge the (key, hold_ticks) taps drained in one tick.
+
+    Repeats of a key collapse into one entry with the longest hold, kept at
+    the key's first occurrence so menu sequences keep their meaning
+    (ESCAPE, MENU_SELECT, ESCAPE still opens the menu before selecting).  A
+    later opposite movement drops the earlier direction outright instead of
+    replaying it.
+    """
+    if len(events) < 2:
+        return events
+    merged: dict[UboKey, int] = {}
+    for key, hold_ticks in events:
+        opposite = MOVEMENT_OPPOSITE.get(key)
+        if opposite is not None:
+            merged.pop(opposite, None)
+        merged[key] = max(merged.get(key, 0), hold_ticks)
+    return list(merged.items())
+
+
+def validate_tick_sched(mode: str) -> None:
+    """Raise ValueError unless *mode* is one of TICK_SCHED_MODES."""
+    if mode not in TICK_SCHED_MODES:
+        raise ValueError(f"Unknown UBO_DOOM_TICK_SCHED {mode!r} (expected one of {TICK_SCHED_MODES})")
+
+
+def raise_tick_priority(mode: str) -> None:
+    """
+    Raise the calling thread's scheduling priority (Linux applies both calls
+    per thread).  Lacking privileges is not fatal: the reason is printed and
+    the thread keeps running at normal priority.
+    """
+    if mode == "off":
+        return
+    if mode == "fifo":
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(TICK_FIFO_PRIORITY))
+            return
+        except (PermissionError, AttributeError) as exc:
+            print(f"[doom] SCHED_FIFO unavailable ({exc}); falling back to nice {TICK_NICE}", flush=True)
+    try:
+        os.nice(TICK_NICE)
+    except OSError as exc:
+        print(f"[doom] could not raise doom-tick priority ({exc})", flush=True)
@@ -0,0 +1,215 @@
+"""
+ubo_service/070-doom/doom_video.py
+
+Doom framebuffer -> LCD frame conversion: scales the 320x200 RGBA framebuffer
+to 240x150, letterboxes it to 240x240 and packs RGB565 big-endian for
+render_block().  Needs only numpy (numba for UBO_DOOM_VIDEO=numba), so it can
+be unit-tested without Kivy or ubo_app.
+"""
+
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Final
+
+import numpy as np
+
+from native.doom_lib import DoomLib
+
+
+# LCD geometry (ubo display uses inclusive rectangle coords: (x0,y0,x1,y1))
+OUT_W: Final[int] = 240
+OUT_H: Final[int] = 240
+RECT_FULL: Final[tuple[int, int, int, int]] = (0, 0, OUT_W - 1, OUT_H - 1)
+
+# Letterbox parameters for 320x200 -> 240x150 centered
+ACTIVE_H: Final[int] = 150
+PAD_TOP: Final[int] = (OUT_H - ACTIVE_H) // 2  # 45
+# Active (non-letterbox) rows only, and their byte range within a full frame.
+RECT_ACTIVE: Final[tuple[int, int, int, int]] = (0, PAD_TOP, OUT_W - 1, PAD_TOP + ACTIVE_H - 1)
+ACTIVE_BYTES: Final[slice] = slice(PAD_TOP * OUT_W * 2, (PAD_TOP + ACTIVE_H) * OUT_W * 2)
+
+# One Doom RGBA8888 pixel viewed as a single word; explicitly little-endian so
+# R is always the low byte regardless of host byte order.
+RGBA_U32: Final[np.dtype] = np.dtype("<u4")
+
+# Selectable RGBA -> RGB565 conversion backends (UBO_DOOM_VIDEO).
+VIDEO_BACKENDS: Final[tuple[str, ...]] = ("native", "numpy", "numba")
+
+
+def load_numba_pack() -> Callable[..., None]:
+    """Return the fused Numba scale + RGB565 pack kernel.
+
+    numba is an optional dependency, only imported when UBO_DOOM_VIDEO=numba.
+    Compiled code is cached next to this file, so only the very first run on a
+    device pays the LLVM compile cost.  The output geometry (OUT_W, PAD_TOP,
+    ACTIVE_H) is read as module globals, which numba freezes as compile-time
+    constants, so row offsets and loop bounds fold to literals.
+
+    Raises:
+        RuntimeError: numba is requested but not installed.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError as exc:
+        raise RuntimeError(
+            "UBO_DOOM_VIDEO=numba requires the 'numba' package (pip install numba)"
+        ) from exc
+
+    # Explicit signature: compiled eagerly (on the init thread, when the pipe is
+    # created) and restricted to C-contiguous 1-D arrays, so a wrongly laid-out
+    # input fails loudly instead of triggering a new specialization mid-game.
+    @njit(
+        "void(uint32[::1], int32[::1], int32[::1], uint8[::1], intp)",
+        cache=True, parallel=True, fastmath=True, boundscheck=False,
+    )
+    def _pack(rgba_u32, x_src, y_src, out, src_w):
+        # One pass over the active rows: sample one uint32 pixel through the
+        # nearest-neighbor maps and store RGB565 big-endian in-line (no separate
+        # byteswap pass).  Letterbox rows are zero from allocation and are never
+        # written.
+        for y in prange(ACTIVE_H):
+            row = (PAD_TOP + y) * OUT_W * 2
+            src_row = y_src[y] * src_w
+            for x in range(OUT_W):
+                p = rgba_u32[src_row + x_src[x]]
+                v = ((p & 0xF8) << 8) | ((p >> 5) & 0x07E0) | ((p >> 19) & 0x001F)
+                out[row + 2 * x] = v >> 8
+                out[row + 2 * x + 1] = v & 0xFF
+
+    return _pack
+
+
+@dataclass
+class VideoPipe:
+    """
+    Converts Doom RGBA (src_w x src_h) -> 240x240 RGB565 (big-endian), letterboxed.
+
+    Pixels are read as one little-endian uint32 each (R in the low byte) and
+    gathered through a precomputed flat nearest-neighbor index.  Output buffers
+    are zeroed once at creation and only the active rows are rewritten per
+    frame, so the letterbox bars stay black without a per-frame clear.  The
+    finished frame always lives in the persistent out_bytes buffer (RGB565
+    big-endian); with the "numba" backend the whole conversion is one fused
+    kernel writing into it, and with "native" libubodoom.so fills it directly
+    from the paletted screen.  Only the active rows (out_active) are copied out
+    per frame; the black bars are painted once by the display thread.
+    """
+
+    src_w: int
+    src_h: int
+    x_src: np.ndarray
+    y_src: np.ndarray
+    gather: np.ndarray
+    scaled_u32: np.ndarray
+    out_rgb565: np.ndarray
+    scratch565: np.ndarray
+    out_bytes: np.ndarray
+    out_be: np.ndarray
+    out_active: np.ndarray
+    pack: Callable[..., None] | None = None
+    native: DoomLib | None = None
+    last_crc: int | None = None
+
+    @classmethod
+    def create(
+        cls, *, src_w: int, src_h: int, backend: str = "numpy", doom: DoomLib | None = None
+    ) -> "VideoPipe":
+        if backend not in VIDEO_BACKENDS:
+            raise ValueError(f"Unknown UBO_DOOM_VIDEO backend {backend!r} (expected one of {VIDEO_BACKENDS})")
+        if backend == "native" and doom is None:
+            raise ValueError("UBO_DOOM_VIDEO=native converts inside libubodoom.so and needs its DoomLib")
+
+        # Nearest-neighbor mapping indices:
+        #  - 240 samples across width
+        #  - 150 samples across height
+        x_src = np.ascontiguousarray((np.arange(OUT_W) * src_w) // OUT_W, dtype=np.int32)
+        y_src = np.ascontiguousarray((np.arange(ACTIVE_H) * src_h) // ACTIVE_H, dtype=np.int32)
+        # Flat source pixel index for every active output pixel (row-major).
+        gather = (y_src[:, None] * src_w + x_src[None, :]).ravel().astype(np.intp)
+
+        scaled_u32 = np.zeros(ACTIVE_H * OUT_W, dtype=RGBA_U32)    # gathered pixels
+        out_rgb565 = np.zeros(ACTIVE_H * OUT_W, dtype=np.uint16)   # RGB565, native order
+        scratch565 = np.zeros(ACTIVE_H * OUT_W, dtype=np.uint16)   # pack temporary
+        out_bytes = np.zeros(OUT_W * OUT_H * 2, dtype=np.uint8)    # RGB565 big-endian
+        # Big-endian uint16 view of the active rows of out_bytes: storing native
+        # values through it does the byte swap as part of the copy.
+        out_be = out_bytes.view(">u2")[PAD_TOP * OUT_W:(PAD_TOP + ACTIVE_H) * OUT_W]
+
+        return cls(
+            src_w=src_w,
+            src_h=src_h,
+            x_src=x_src,
+            y_src=y_src,
+            gather=gather,
+            scaled_u32=scaled_u32,
+            out_rgb565=out_rgb565,
+            scratch565=scratch565,
+            out_bytes=out_bytes,
+            out_be=out_be,
+            out_active=out_bytes[ACTIVE_BYTES],
+            pack=load_numba_pack() if backend == "numba" else None,
+            native=doom if backend == "native" else None,
+        )
+
+    def frame_changed(self, rgba_u32: np.ndarray) -> bool:
+        """
+        Return False if rgba_u32 is byte-identical to the last frame checked.
+
+        Title screen, menus and intermissions repeat the same frame for many
+        ticks; a CRC-32 of the source (~256 KB) is far cheaper than scaling,
+        packing and pushing an unchanged frame over SPI.
+        """
+        crc = zlib.crc32(rgba_u32)
+        if crc == self.last_crc:
+            return False
+        self.last_crc = crc
+        return True
+
+    def reset(self) -> None:
+        """
+        Forget the last frame so the next frame_changed() reports a change.
+
+        Call whenever the display thread restarts: it blacks the whole screen,
+        so a static frame (menu, intermission) must be pushed again.
+        """
+        self.last_crc = None
+
+    def rgba_to_rgb565_be(self, rgba_u32: np.ndarray) -> bytes:
+        """
+        rgba_u32: flat numpy view of src_h*src_w RGBA pixels, dtype RGBA_U32
+
+        Returns the active rows only (240*150*2 bytes), RGB565 big-endian, ready
+        for render_block on RECT_ACTIVE.
+        """
+        if self.native is not None:
+            self.native.rgb565_be_into(self.out_bytes.ctypes.data, OUT_W, OUT_H, PAD_TOP)
+            return self.out_active.tobytes()
+
+        if self.pack is not None:
+            self.pack(rgba_u32, self.x_src, self.y_src, self.out_bytes, self.src_w)
+            return self.out_active.tobytes()
+
+        # scale the active region: one contiguous gather of 4-byte pixels
+        px = self.scaled_u32
+        np.take(rgba_u32, self.gather, out=px)
+
+        # pack to RGB565 in place with pure bit twiddling on the uint32 words:
+        #   rgb565 = ((p & 0xF8) << 8) | ((p >> 5) & 0x07E0) | ((p >> 19) & 0x001F)
+        # Each shift lands directly in the preallocated uint16 buffers, so there
+        # are no per-channel planes and no per-frame temporaries.
+        out, tmp = self.out_rgb565, self.scratch565
+        np.bitwise_and(px, 0xF8, out=out, casting="unsafe")              # R
+        np.left_shift(out, 8, out=out)
+        np.right_shift(px, 5, out=tmp, casting="unsafe")                 # G
+        np.bitwise_and(tmp, 0x07E0, out=tmp)
+        np.bitwise_or(out, tmp, out=out)
+        np.right_shift(px, 19, out=tmp, casting="unsafe")                # B
+        np.bitwise_and(tmp, 0x001F, out=tmp)
+        np.bitwise_or(out, tmp, out=out)
+
+        # ST7789 expects big-endian bytes: swap while storing into out_bytes
+        # (letterbox rows stay zero) instead of allocating a byteswap() copy.
+        self.out_be[:] = out
+        return self.out_active.tobytes()
@@ -33,6 +33,14 @@ class UboKey(IntEnum):
     MENU_SELECT = 8  # maps to KEY_ENTER — only safe for menus (not in-game: stolen by HU_MSGREFRESH)
 
 
+# libubodoom ABI revision this wrapper is written against (UBO_DOOM_API_VERSION
+# in doom_api.h).
+DOOM_API_VERSION: Final[int] = 1
+
+# Events passed per doom_post_keys() call; a tick rarely posts more than a few.
+KEY_BATCH_MAX: Final[int] = 64
+
+
 @dataclass(frozen=True)
 class DoomFramebufferInfo:
     width: int
@@ -46,16 +54,20 @@ class DoomLib:
     third_party/DOOM-master/linuxdoom-1.10 source tree.
 
         Exported C API:
+      int  doom_api_version(void);      // must equal DOOM_API_VERSION
       int  doom_init(const char* iwad_path);
-      void doom_tick(void);
+      int  doom_tick(void);             // 1 = still alive after the tic
       void doom_shutdown(void);
 
       void doom_key_down(ubo_key_t key);
       void doom_key_up(ubo_key_t key);
+      int  doom_post_keys(const int* events, int n);  // +k = down, -k = up
 
       const uint8_t* doom_get_rgba_ptr(void);
       int  doom_get_rgba_width(void);   // expected 320
       int  doom_get_rgba_height(void);  // expected 200
+
+      int  doom_get_rgb565_be(uint8_t* out, int out_w, int out_h, int pad_top);
     """
 
     def __init__(self, lib_path: Path) -> None:
@@ -64,13 +76,33 @@ class DoomLib:
 
         self._lib = ctypes.CDLL(str(lib_path))
 
+        # int doom_api_version(void);
+        # Checked before anything else is bound, and the one compatibility check:
+        # a library built from an older tree may export doom_tick as void (its
+        # return register read as the alive flag would report random engine
+        # deaths) or lack doom_post_keys / doom_get_rgb565_be entirely.  Every
+        # export below is required at the checked version.
+        if not hasattr(self._lib, "doom_api_version"):
+            raise RuntimeError(
+                f"{lib_path} predates doom_api_version() (API {DOOM_API_VERSION} required); "
+                "rebuild libubodoom.so"
+            )
+        self._lib.doom_api_version.argtypes = []
+        self._lib.doom_api_version.restype = ctypes.c_int
+        version = int(self._lib.doom_api_version())
+        if version != DOOM_API_VERSION:
+            raise RuntimeError(
+                f"{lib_path} implements libubodoom API {version}, expected {DOOM_API_VERSION}; "
+                "rebuild libubodoom.so"
+            )
+
         # int doom_init(const char* iwad_path);
         self._lib.doom_init.argtypes = [ctypes.c_char_p]
         self._lib.doom_init.restype = ctypes.c_int
 
-        # void doom_tick(void);
+        # int doom_tick(void);  — returns doom_is_alive() after the tic
         self._lib.doom_tick.argtypes = []
-        self._lib.doom_tick.restype = None
+        self._lib.doom_tick.restype = ctypes.c_int
 
         # void doom_shutdown(void);
         self._lib.doom_shutdown.argtypes = []
@@ -84,6 +116,16 @@ class DoomLib:
         self._lib.doom_key_up.argtypes = [ctypes.c_int]
         self._lib.doom_key_up.restype = None
 
+        # Prebuilt c_int arguments per key so key_down/key_up skip the
+        # int() conversion and ctypes argument boxing on every event.
+        self._key_args: dict[int, ctypes.c_int] = {int(k): ctypes.c_int(int(k)) for k in UboKey}
+
+        # int doom_post_keys(const int* events, int n);
+        self._lib.doom_post_keys.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        self._lib.doom_post_keys.restype = ctypes.c_int
+        # Reused event buffer for post_keys (one FFI call per batch).
+        self._key_events = (ctypes.c_int * KEY_BATCH_MAX)()
+
         # int doom_is_alive(void);
         self._lib.doom_is_alive.argtypes = []
         self._lib.doom_is_alive.restype = ctypes.c_int
@@ -112,6 +154,10 @@ class DoomLib:
         self._lib.doom_get_rgba_height.argtypes = []
         self._lib.doom_get_rgba_height.restype = ctypes.c_int
 
+        # int doom_get_rgb565_be(uint8_t* out, int out_w, int out_h, int pad_top);
+        self._lib.doom_get_rgb565_be.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int]
+        self._lib.doom_get_rgb565_be.restype = ctypes.c_int
+
         # Optional globals exported by the patch:
         #   extern int ubo_library_mode;
         #   extern uint8_t ubo_rgba[320 * 200 * 4];
@@ -134,14 +180,30 @@ class DoomLib:
     def shutdown(self) -> None:
         self._lib.doom_shutdown()
 
-    def tick(self) -> None:
-        self._lib.doom_tick()
+    def tick(self) -> bool:
+        """Run one tic; True if the engine is still alive afterwards."""
+        return self._lib.doom_tick() == 1
 
     def key_down(self, key: UboKey | int) -> None:
-        self._lib.doom_key_down(int(key))
+        arg = self._key_args.get(key)
+        self._lib.doom_key_down(arg if arg is not None else int(key))
 
     def key_up(self, key: UboKey | int) -> None:
-        self._lib.doom_key_up(int(key))
+        arg = self._key_args.get(key)
+        self._lib.doom_key_up(arg if arg is not None else int(key))
+
+    def post_keys(self, events: list[int]) -> None:
+        """
+        Post key events in order with a single FFI call per KEY_BATCH_MAX
+        events: +int(key) for key_down, -int(key) for key_up.
+        """
+        buf = self._key_events
+        for start in range(0, len(events), KEY_BATCH_MAX):
+            chunk = events[start:start + KEY_BATCH_MAX]
+            buf[:len(chunk)] = chunk
+            rc = int(self._lib.doom_post_keys(buf, len(chunk)))
+            if rc != 0:
+                raise RuntimeError(f"doom_post_keys failed rc={rc} (n={len(chunk)})")
 
     def is_alive(self) -> bool:
         return bool(self._lib.doom_is_alive())
@@ -168,3 +230,22 @@ class DoomLib:
 
     def rgba_ptr(self) -> ctypes.POINTER(ctypes.c_uint8):
         return self._lib.doom_get_rgba_ptr()
+
+    def rgba_buffer(self, fb: DoomFramebufferInfo) -> ctypes.Array:
+        """
+        The RGBA framebuffer as a fixed-size ctypes array over the library's
+        static buffer (zero-copy; supports the buffer protocol).  Build it once
+        and keep views of it — the address never changes after doom_init().
+        """
+        nbytes = fb.width * fb.height * fb.bytes_per_pixel
+        addr = ctypes.addressof(self.rgba_ptr().contents)
+        return (ctypes.c_uint8 * nbytes).from_address(addr)
+
+    def rgb565_be_into(self, out_addr: int, out_w: int, out_h: int, pad_top: int) -> None:
+        """Scale + pack the current frame in C into out_w*out_h*2 bytes at out_addr.
+
+        Output is RGB565 big-endian with pad_top black rows top and bottom.
+        """
+        rc = int(self._lib.doom_get_rgb565_be(out_addr, out_w, out_h, pad_top))
+        if rc != 0:
+            raise RuntimeError(f"doom_get_rgb565_be failed rc={rc} (out={out_w}x{out_h}, pad_top={pad_top})")
@@ -7,9 +7,14 @@ library (`libubodoom.so`) without forking ubo_app.
 
 Video:
 - Doom exports an RGBA8888 framebuffer (expected 320x200) via the patch API.
-- This service scales it to 240x150 and letterboxes to 240x240 (45px top/bottom).
-- Converts to RGB565 (big-endian) and writes directly to the LCD via:
+- The frame is scaled to 240x150 and letterboxed to 240x240 (45px top/bottom).
+- Converted to RGB565 (big-endian) and written directly to the LCD via:
     ubo_app.display.display.render_block(..., bypass_pause=True)
+- By default the scale + pack runs inside libubodoom.so (doom_get_rgb565_be,
+  straight from the 8-bit paletted screen); the numpy/numba backends do the same
+  conversion in Python from the RGBA framebuffer.
+- The SPI write runs on a separate doom-display thread fed by a one-frame
+  "latest wins" slot, so the next doom tick overlaps the previous transfer.
 
 Audio:
 - Doom outputs directly to ALSA inside the shared library (Option A).
@@ -35,16 +40,27 @@ Environment:
 - UBO_DOOM_LIB  : path to libubodoom.so (default: ~/doom/libubodoom.so)
 - UBO_DOOM_IWAD : path to IWAD (.wad)   (default: ~/doom/doom2.wad)
 - UBO_DOOM_FPS  : target fps (default: 30)
+- UBO_DOOM_VIDEO: RGB565 conversion backend: "native" (default; in libubodoom.so),
+                  "numpy", or "numba" (fused single-pass kernel; requires
+                  `pip install numba`)
+- UBO_DOOM_TICK_SCHED: doom-tick thread priority: "nice" (default; nice -5),
+                  "fifo" (SCHED_FIFO, falls back to nice), or "off".  Needs
+                  CAP_SYS_NICE; without it the thread keeps normal priority.
+- UBO_DOOM_VERBOSE: "1" logs every key_down/key_up from libubodoom.so to stderr
+                  (default off)
 
 This file is aligned with the exported symbols from the pre-modified
 `third_party/DOOM-master/linuxdoom-1.10` source build,
 as wrapped by `ubo_service/070-doom/native/doom_lib.py`:
+  - doom_api_version              (checked at load; must match DOOM_API_VERSION)
   - doom_init
   - doom_tick
   - doom_shutdown
   - doom_key_down / doom_key_up   (takes ubo_key_t / UboKey)
+  - doom_post_keys                (batched key events, one call per tick)
   - doom_get_rgba_ptr
   - doom_get_rgba_width / doom_get_rgba_height
+  - doom_get_rgb565_be            (UBO_DOOM_VIDEO=native)
 """
 
 from __future__ import annotations
@@ -55,7 +71,6 @@ import sys
 import threading
 import time
 import traceback
-from dataclasses import dataclass
 from pathlib import Path
 from typing import Final
 
@@ -77,17 +92,23 @@ _SERVICE_DIR = os.path.dirname(os.path.abspath(__file__))
 if _SERVICE_DIR not in sys.path:
     sys.path.insert(0, _SERVICE_DIR)
 from doom_controller import DoomController
+from doom_tick import (
+    MOVEMENT_OPPOSITE,
+    coalesce_taps,
+    drain_queue,
+    raise_tick_priority,
+    validate_tick_sched,
+)
+from doom_video import OUT_H, OUT_W, RECT_ACTIVE, RECT_FULL, RGBA_U32, VideoPipe
 from native.doom_lib import DoomLib, UboKey
 
 
-# LCD geometry (ubo display uses inclusive rectangle coords: (x0,y0,x1,y1))
-OUT_W: Final[int] = 240
-OUT_H: Final[int] = 240
-RECT_FULL: Final[tuple[int, int, int, int]] = (0, 0, OUT_W - 1, OUT_H - 1)
+# Without input, gamestate/menuactive are re-read from the engine only every
+# this many ticks; ticks that drained key events always re-read them.
+STATE_POLL_TICKS: Final[int] = 8
 
-# Letterbox parameters for 320x200 -> 240x150 centered
-ACTIVE_H: Final[int] = 150
-PAD_TOP: Final[int] = (OUT_H - ACTIVE_H) // 2  # 45
+# Held-key countdown slots, indexed directly by UboKey value (slot 0 unused).
+HELD_SLOTS: Final[int] = max(UboKey) + 1
 
 
 def _resolve_launch_paths(iwad_path_raw: str) -> tuple[str, str, str]:
@@ -113,65 +134,6 @@ def _resolve_launch_paths(iwad_path_raw: str) -> tuple[str, str, str]:
     return str(iwad_path), str(launch_cwd), str(config_path)
 
 
-@dataclass
-class _VideoPipe:
-    """
-    Converts Doom RGBA (src_w x src_h) -> 240x240 RGB565 (big-endian), letterboxed.
-
-    Uses numpy views + precomputed nearest-neighbor index maps.
-    """
-
-    src_w: int
-    src_h: int
-    x_src: np.ndarray
-    y_src: np.ndarray
-    out_rgb: np.ndarray
-    out_rgb565: np.ndarray
-
-    @classmethod
-    def create(cls, *, src_w: int, src_h: int) -> "_VideoPipe":
-        # Nearest-neighbor mapping indices:
-        #  - 240 samples across width
-        #  - 150 samples across height
-        x_src = (np.arange(OUT_W, dtype=np.int32) * src_w) // OUT_W
-        y_src = (np.arange(ACTIVE_H, dtype=np.int32) * src_h) // ACTIVE_H
-
-        out_rgb = np.zeros((OUT_H, OUT_W, 3), dtype=np.uint8)      # RGB888
-        out_rgb565 = np.zeros((OUT_H, OUT_W), dtype=np.uint16)     # RGB565
-
-        return cls(
-            src_w=src_w,
-            src_h=src_h,
-            x_src=x_src,
-            y_src=y_src,
-            out_rgb=out_rgb,
-            out_rgb565=out_rgb565,
-        )
-
-    def rgba_to_rgb565_be(self, rgba_view: np.ndarray) -> bytes:
-        """
-        rgba_view: numpy view shaped (src_h, src_w, 4) uint8
-
-        Returns bytes length = 240*240*2, RGB565 big-endian, ready for render_block.
-        """
-        # clear to black (letterbox bars)
-        self.out_rgb.fill(0)
-
-        # scale + place active region
-        scaled_rgb = rgba_view[self.y_src[:, None], self.x_src[None, :], :3]  # (150,240,3)
-        self.out_rgb[PAD_TOP:PAD_TOP + ACTIVE_H, :, :] = scaled_rgb
-
-        # pack to RGB565
-        r = self.out_rgb[:, :, 0].astype(np.uint16)
-        g = self.out_rgb[:, :, 1].astype(np.uint16)
-        b = self.out_rgb[:, :, 2].astype(np.uint16)
-
-        self.out_rgb565[:, :] = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
-
-        # ST7789 expects big-endian bytes
-        return self.out_rgb565.byteswap().tobytes()
-
-
 class DoomPage(UboPageWidget):
     """
     Owns the LCD while active.
@@ -182,19 +144,42 @@ class DoomPage(UboPageWidget):
         self._key_queue: queue.Queue[tuple[UboKey, int]] = queue.Queue()
         # Controller owns all input-routing state; DoomPage is a thin shell.
         self._controller = DoomController(tap_fn=self._tap)
+        # Footer item lists for both modes, built once and swapped on toggle.
+        self._items_normal = [
+            ActionItem(label="ALT", icon="", action=self._toggle_mode),
+            ActionItem(label="◄", icon="", action=self._btn_l2),
+            ActionItem(label="►/OK", icon="", action=self._btn_l3),
+        ]
+        self._items_alt = [
+            ActionItem(label="NRM", icon="", action=self._toggle_mode),
+            ActionItem(label="USE", icon="", action=self._btn_l2),
+            ActionItem(label="ESC", icon="", action=self._btn_l3),
+        ]
         # Footer: L1=mode toggle, L2/L3 depend on mode (alt_mode starts False).
         kwargs.setdefault("items", self._make_items())
         super().__init__(**kwargs)
 
         self._fps = float(os.environ.get("UBO_DOOM_FPS", "30"))
+        self._video_backend = os.environ.get("UBO_DOOM_VIDEO", "native").strip().lower()
+        self._tick_sched = os.environ.get("UBO_DOOM_TICK_SCHED", "nice").strip().lower()
         self._doom: DoomLib | None = None
-        self._video: _VideoPipe | None = None
-        self._rgba_view: "np.ndarray | None" = None
-        # Held-key countdown dict — only accessed by the tick thread.
-        self._held: dict[UboKey, int] = {}
+        self._video: VideoPipe | None = None
+        self._rgba_u32: "np.ndarray | None" = None
+        # Held-key countdowns indexed by UboKey value (0 = not held) — only
+        # accessed by the tick thread.
+        self._held: list[int] = [0] * HELD_SLOTS
         # Stop signal and thread handle for the tick loop.
         self._stop_evt = threading.Event()
         self._thread: threading.Thread | None = None
+        # Latest converted frame handed from the tick thread to the display
+        # thread (one slot, latest wins: stale frames are dropped, never queued).
+        self._fb_slot: list[bytes | None] = [None]
+        self._fb_evt = threading.Event()
+        self._display_thread: threading.Thread | None = None
+        # Clock callbacks posted from the tick thread, bound once so the loop
+        # doesn't build a fresh closure each time it schedules one.
+        self._cb_exit_level = lambda _dt=0: self._exit_level()
+        self._cb_doom_died = lambda _dt=0: self._on_doom_died()
 
         self._lib_path = Path(os.environ.get("UBO_DOOM_LIB", str(Path.home() / "doom" / "libubodoom.so")))
         iwad_default = os.environ.get("UBO_DOOM_IWAD", str(Path.home() / "doom" / "doom2.wad"))
@@ -220,6 +205,7 @@ class DoomPage(UboPageWidget):
                 f"[doom] launch paths: cwd={self._launch_cwd} config={self._config_path} iwad={self._iwad_path}",
                 flush=True,
             )
+            validate_tick_sched(self._tick_sched)
             self._doom = DoomLib(self._lib_path)
             self._doom.init(self._iwad_path)
 
@@ -227,10 +213,12 @@ class DoomPage(UboPageWidget):
             if fb.width <= 0 or fb.height <= 0:
                 raise RuntimeError(f"Invalid Doom framebuffer size: {fb.width}x{fb.height}")
 
-            rgba_ptr = self._doom.rgba_ptr()
-            flat = np.ctypeslib.as_array(rgba_ptr, shape=(fb.width * fb.height * 4,))
-            self._rgba_view = flat.reshape((fb.height, fb.width, 4))
-            self._video = _VideoPipe.create(src_w=fb.width, src_h=fb.height)
+            # One persistent zero-copy view of the library's framebuffer, one
+            # uint32 per pixel.
+            self._rgba_u32 = np.frombuffer(self._doom.rgba_buffer(fb), dtype=RGBA_U32)
+            self._video = VideoPipe.create(
+                src_w=fb.width, src_h=fb.height, backend=self._video_backend, doom=self._doom
+            )
 
             # Schedule tick start back on the Kivy main thread.
             Clock.schedule_once(lambda _dt: self._start_tick(), 0)
@@ -245,8 +233,22 @@ class DoomPage(UboPageWidget):
             )
 
     def _start_tick(self) -> None:
-        if self._thread is None or not self._thread.is_alive():
+        start_tick = self._thread is None or not self._thread.is_alive()
+        if start_tick:
             self._stop_evt.clear()
+        # Display thread first: it blacks the whole screen on start, so drop
+        # any stale frame and forget the last CRC before the tick thread can
+        # publish again — otherwise an unchanged static frame (menu, paused
+        # game, intermission) would never be resent and the LCD stays black.
+        if self._display_thread is None or not self._display_thread.is_alive():
+            self._fb_slot[0] = None
+            if self._video is not None:
+                self._video.reset()
+            self._display_thread = threading.Thread(
+                target=self._display_loop, daemon=True, name="doom-display"
+            )
+            self._display_thread.start()
+        if start_tick:
             self._thread = threading.Thread(
                 target=self._tick_loop, daemon=True, name="doom-tick"
             )
@@ -265,18 +267,8 @@ class DoomPage(UboPageWidget):
         return self._controller.go_back()
 
     def _make_items(self) -> list:
-        """Build footer ActionItems for the current mode."""
-        if self._controller.alt_mode:
-            return [
-                ActionItem(label="NRM", icon="", action=self._toggle_mode),
-                ActionItem(label="USE", icon="", action=self._btn_l2),
-                ActionItem(label="ESC", icon="", action=self._btn_l3),
-            ]
-        return [
-            ActionItem(label="ALT", icon="", action=self._toggle_mode),
-            ActionItem(label="◄", icon="", action=self._btn_l2),
-            ActionItem(label="►/OK", icon="", action=self._btn_l3),
-        ]
+        """Footer ActionItems for the current mode (prebuilt in __init__)."""
+        return self._items_alt if self._controller.alt_mode else self._items_normal
 
     def _toggle_mode(self) -> None:
         if self._controller.toggle_mode():
@@ -295,7 +287,7 @@ class DoomPage(UboPageWidget):
 
     def _tap(self, key: UboKey, hold_ticks: int = 2) -> None:
         # Non-blocking: enqueue the event for the tick thread to process.
-        # The tick thread calls key_down and manages the hold countdown.
+        # The tick thread posts key_down and manages the hold countdown.
         if self._doom is None:
             return
         self._key_queue.put_nowait((key, hold_ticks))
@@ -307,83 +299,143 @@ class DoomPage(UboPageWidget):
         """Runs entirely on the doom-tick background thread."""
         doom = self._doom
         video = self._video
-        rgba_view = self._rgba_view
-        if doom is None or video is None or rgba_view is None:
+        rgba_u32 = self._rgba_u32
+        held = self._held
+        if doom is None or video is None or rgba_u32 is None:
             return
 
+        raise_tick_priority(self._tick_sched)
+
+        # Bind everything the loop touches as locals (LOAD_FAST instead of
+        # attribute lookups on every tick).
+        post_keys = doom.post_keys
+        tick = doom.tick
+        gamestate = doom.gamestate
+        menuactive = doom.menuactive
+        update_state = self._controller.update_game_state
+        key_queue = self._key_queue
+        drain = drain_queue
+        coalesce = coalesce_taps
+        movement_opposite = MOVEMENT_OPPOSITE
+        stop_set = self._stop_evt.is_set
+        frame_changed = video.frame_changed
+        convert = video.rgba_to_rgb565_be
+        fb_slot = self._fb_slot
+        fb_evt = self._fb_evt
+        schedule = Clock.schedule_once
+        monotonic = time.monotonic
+        sleep = time.sleep
+
         interval = 1.0 / self._fps
         frame = 0
-        _MOVEMENT_OPPOSITE: dict[UboKey, UboKey] = {
-            UboKey.UP: UboKey.DOWN,
-            UboKey.DOWN: UboKey.UP,
-        }
-        while not self._stop_evt.is_set():
-            t0 = time.monotonic()
-
-            # Drain key events posted by the main thread.
-            while True:
-                try:
-                    key, hold_ticks = self._key_queue.get_nowait()
-                    # Cancel the opposite movement direction immediately so
-                    # a lingering hold_ticks countdown can't cause both UP
-                    # and DOWN to be active in gamekeydown simultaneously.
-                    opposite = _MOVEMENT_OPPOSITE.get(key)
-                    if opposite is not None and opposite in self._held:
-                        doom.key_up(opposite)
-                        del self._held[opposite]
-                    if key not in self._held:
-                        doom.key_down(key)
-                    self._held[key] = hold_ticks  # (re)set countdown
-                except queue.Empty:
-                    break
+        # Key events for this tick (+key = down, -key = up), posted to the
+        # engine in one FFI call just before doom_tick().
+        posted: list[int] = []
+        # Absolute-deadline schedule: a frame that oversleeps or runs a little
+        # long is made up on the next one instead of drifting the whole loop.
+        next_deadline = monotonic()
+        while not stop_set():
+            # Drain key events posted by the main thread (one lock, no
+            # queue.Empty raised on the common empty tick) and merge repeated
+            # taps (see coalesce_taps).
+            events = coalesce(drain(key_queue))
+            for key, hold_ticks in events:
+                # Cancel the opposite movement direction immediately so
+                # a lingering hold_ticks countdown can't cause both UP
+                # and DOWN to be active in gamekeydown simultaneously.
+                opposite = movement_opposite.get(key)
+                if opposite is not None and held[opposite]:
+                    posted.append(-opposite)
+                    held[opposite] = 0
+                if not held[key]:
+                    posted.append(key)
+                held[key] = max(hold_ticks, 1)  # (re)set countdown; 0 means released
 
             # Release any held keys whose countdown has expired.
-            # Runs BEFORE doom.tick() so key_up is in the event queue when
-            # D_ProcessEvents drains it on this same tick.
-            for key in list(self._held):
-                self._held[key] -= 1
-                if self._held[key] <= 0:
-                    doom.key_up(key)
-                    del self._held[key]
-
-            doom.tick()
+            # Posted BEFORE doom.tick() so the key_up is in the event queue
+            # when D_ProcessEvents drains it on this same tick.
+            for key, ticks in enumerate(held):
+                if ticks:
+                    ticks -= 1
+                    held[key] = ticks
+                    if not ticks:
+                        posted.append(-key)
+            if posted:
+                post_keys(posted)
+                posted.clear()
+
+            # doom_tick() reports liveness itself: no separate is_alive() call.
+            alive = tick()
             frame += 1
 
             # Update controller's cached state (tick thread → main-thread reads).
             # update_game_state() returns True when the game just left a level,
             # which triggers an exit_level() call on the Kivy main thread.
-            alive = doom.is_alive()
-            just_left_level = self._controller.update_game_state(
-                alive=alive,
-                gamestate=doom.gamestate() if alive else -1,
-                menuactive=bool(doom.menuactive()) if alive else False,
-            )
-            if just_left_level:
-                Clock.schedule_once(lambda _dt: self._exit_level(), 0)
+            # Menu/level state only changes in response to input or on its own
+            # at level transitions, so idle ticks poll it every STATE_POLL_TICKS
+            # (a level exit is noticed at most that many ticks late).
+            if events or frame % STATE_POLL_TICKS == 0 or not alive:
+                just_left_level = update_state(
+                    alive=alive,
+                    gamestate=gamestate() if alive else -1,
+                    menuactive=bool(menuactive()) if alive else False,
+                )
+                if just_left_level:
+                    schedule(self._cb_exit_level, 0)
 
             # If I_Error or SIGSEGV fired mid-tick the engine marks itself dead.
-            if not doom.is_alive():
-                self._held.clear()
+            if not alive:
+                held[:] = [0] * HELD_SLOTS
+                fb_slot[0] = None
                 doom.reset()
-                Clock.schedule_once(lambda _dt: self._on_doom_died(), 0)
+                schedule(self._cb_doom_died, 0)
                 return
 
             # Render to LCD every other game tick (~15fps LCD vs 30fps physics).
             # This halves SPI DMA bandwidth, reducing contention with the WiFi
             # SDIO controller on the RPi4 AXI bus (known SPI/SDIO DMA conflict).
-            if frame % 2 == 0:
-                rgb565_be = video.rgba_to_rgb565_be(rgba_view)
-                lcd_display.render_block(
-                    rectangle=RECT_FULL,
-                    data_bytes=rgb565_be,
-                    bypass_pause=True,
-                )
+            # Frames identical to the last one pushed are skipped entirely.
+            # The SPI write itself happens on the display thread, so the next
+            # tick starts while the previous frame is still being sent.
+            if frame % 2 == 0 and frame_changed(rgba_u32):
+                fb_slot[0] = convert(rgba_u32)
+                fb_evt.set()
+
+            # Sleep until this frame's deadline.  If the frame overran it,
+            # restart the schedule from now rather than spinning to catch up.
+            next_deadline += interval
+            now = monotonic()
+            if now < next_deadline:
+                sleep(next_deadline - now)
+            else:
+                next_deadline = now
+
+    def _display_loop(self) -> None:
+        """
+        Runs on the doom-display thread: pushes the latest frame to the LCD.
 
-            # Sleep for whatever is left of the frame budget.
-            elapsed = time.monotonic() - t0
-            remaining = interval - elapsed
-            if remaining > 0:
-                time.sleep(remaining)
+        The letterbox bars never change, so the screen is blacked once per
+        session and after that just the 240x150 active rows go over SPI (~38%
+        less bus time per frame).  Frames arrive as active rows only, so
+        nothing is sliced or copied here.
+        """
+        fb_slot = self._fb_slot
+        fb_evt = self._fb_evt
+        stop_set = self._stop_evt.is_set
+        render_block = lcd_display.render_block
+        render_block(rectangle=RECT_FULL, data_bytes=bytes(OUT_W * OUT_H * 2), bypass_pause=True)
+        while not stop_set():
+            fb_evt.wait()
+            fb_evt.clear()
+            rgb565_be = fb_slot[0]
+            fb_slot[0] = None
+            if rgb565_be is None or stop_set():
+                continue
+            render_block(
+                rectangle=RECT_ACTIVE,
+                data_bytes=rgb565_be,
+                bypass_pause=True,
+            )
 
     def _on_doom_died(self) -> None:
         """Called on the Kivy main thread when the engine dies mid-tick."""
@@ -392,26 +444,29 @@ class DoomPage(UboPageWidget):
         store.dispatch(CloseApplicationEvent(application_instance_id=_instance_id))
 
     def on_close(self) -> None:
-        # Signal the tick thread to stop and wait briefly for it to exit.
+        # Signal the tick and display threads to stop and wait briefly for
+        # them to exit (the display thread is woken so it sees the stop flag).
         self._stop_evt.set()
+        self._fb_evt.set()
         if self._thread is not None:
             self._thread.join(timeout=1.0)
             self._thread = None
-        # Release every held key in Doom before clearing our tracking dict.
+        if self._display_thread is not None:
+            self._display_thread.join(timeout=1.0)
+            self._display_thread = None
+        self._fb_slot[0] = None
+        # Release every held key in Doom before clearing our countdowns.
         # The tick thread may have exited while a key was still held, leaving
         # gamekeydown[key] = true in the C engine permanently.  Sending
         # key_up() for each held key here resets that state so re-entering
         # Doom doesn't inherit stale pressed keys (e.g. perpetual UP/forward).
         if self._doom is not None:
-            for key in list(self._held):
-                self._doom.key_up(key)
-        self._held.clear()
+            for key, ticks in enumerate(self._held):
+                if ticks:
+                    self._doom.key_up(key)
+        self._held[:] = [0] * HELD_SLOTS
         # Drain any queued key events so they don't linger across re-opens.
-        while not self._key_queue.empty():
-            try:
-                self._key_queue.get_nowait()
-            except queue.Empty:
-                break
+        drain_queue(self._key_queue)
 
         # Restore ubo display so the rest of the UI works normally while Doom
         # is not visible.  We do NOT call doom_shutdown here because the Doom
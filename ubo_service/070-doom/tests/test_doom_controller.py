@@ -9,12 +9,16 @@ Run from the ubo_service/070-doom/ directory:
 Or from the workspace root:
     pytest ubo_service/070-doom/
 
-No Kivy, no .so, no ubo_app imports required.  Every test constructs a
-DoomController with a recording tap_fn and then asserts on the emitted keys.
+No Kivy, no .so, no ubo_app imports required.  One DoomController with a
+recording tap_fn is shared per module and reset() before every test; tests
+drive it and then assert on the emitted keys.
 """
 
 from __future__ import annotations
 
+import itertools
+from typing import Callable
+
 import pytest
 
 from doom_controller import DoomController, GS_LEVEL
@@ -30,41 +34,56 @@ GS_DEMOSCREEN = 3
 
 
 class Recorder:
-    """Records (key, hold_ticks) tuples emitted by the controller."""
+    """
+    Records the (key, hold_ticks) taps emitted by the controller.
 
-    def __init__(self) -> None:
-        self.calls: list[tuple[UboKey, int]] = []
+    Keys and holds are kept in parallel lists, and the most recent tap in two
+    plain slots, so tap() allocates no tuple and reading last_key/last_hold is
+    a single attribute load.  Before any tap they hold None / -1, which no
+    expected key or hold matches.
+    """
 
-    def tap(self, key: UboKey, hold_ticks: int) -> None:
-        self.calls.append((key, hold_ticks))
+    __slots__ = ("keys", "holds", "last_key", "last_hold")
 
-    @property
-    def last(self) -> tuple[UboKey, int]:
-        assert self.calls, "no tap was emitted"
-        return self.calls[-1]
+    def __init__(self) -> None:
+        self.keys: list[UboKey] = []
+        self.holds: list[int] = []
+        self.last_key: UboKey | None = None
+        self.last_hold = -1
 
-    @property
-    def last_key(self) -> UboKey:
-        return self.last[0]
+    def tap(self, key: UboKey, hold_ticks: int) -> None:
+        self.keys.append(key)
+        self.holds.append(hold_ticks)
+        self.last_key = key
+        self.last_hold = hold_ticks
 
-    @property
-    def last_hold(self) -> int:
-        return self.last[1]
+    def __len__(self) -> int:
+        return len(self.keys)
 
     def clear(self) -> None:
-        self.calls.clear()
+        self.keys.clear()
+        self.holds.clear()
+        self.last_key = None
+        self.last_hold = -1
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def rec() -> Recorder:
     return Recorder()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def ctrl(rec: Recorder) -> DoomController:
     return DoomController(tap_fn=rec.tap)
 
 
+@pytest.fixture(autouse=True)
+def _fresh_state(ctrl: DoomController, rec: Recorder) -> None:
+    """Share one controller/recorder per module, but start every test clean."""
+    ctrl.reset()
+    rec.clear()
+
+
 def _set_in_level(ctrl: DoomController) -> None:
     """Drive the controller into the in-level state."""
     ctrl.update_game_state(alive=True, gamestate=GS_LEVEL, menuactive=False)
@@ -79,49 +98,120 @@ def _set_intermission(ctrl: DoomController) -> None:
     ctrl.update_game_state(alive=True, gamestate=GS_INTERMISSION, menuactive=False)
 
 
+def _back_key(ctrl: DoomController, rec: Recorder) -> UboKey | None:
+    """Press BACK once and return the single key it emitted."""
+    rec.clear()
+    ctrl.go_back()
+    assert len(rec) == 1, "BACK must emit exactly one tap"
+    return rec.last_key
+
+
+def _set_dead(ctrl: DoomController) -> None:
+    ctrl.update_game_state(alive=False, gamestate=-1, menuactive=False)
+
+
+def _set_default(ctrl: DoomController) -> None:
+    """Leave the controller in its freshly constructed (title/demo) state."""
+
+
+def _set_alt_mode(ctrl: DoomController) -> None:
+    """Enter a level and switch to ALT mode."""
+    _set_in_level(ctrl)
+    ctrl.toggle_mode()
+
+
+# State setups shared by parametrized tests; each case starts from the shared
+# module-level ctrl/rec after the autouse _fresh_state fixture has reset them.
+StateSetup = Callable[[DoomController], None]
+
+BACK_STATES = [
+    pytest.param(_set_default, id="default"),
+    pytest.param(_set_in_level, id="in_level"),
+    pytest.param(_set_menu_open, id="menu"),
+    pytest.param(_set_intermission, id="intermission"),
+]
+
+# Every (alive, gamestate, menuactive) combination update_game_state can see.
+GAME_STATE_CASES = list(
+    itertools.product(
+        (True, False),
+        (GS_LEVEL, GS_INTERMISSION, GS_FINALE, GS_DEMOSCREEN),
+        (True, False),
+    )
+)
+
+MOVEMENT_STATES = [
+    pytest.param(_set_default, id="default"),
+    pytest.param(_set_alt_mode, id="alt"),
+    pytest.param(_set_menu_open, id="menu"),
+]
+
+# (button, state, expected key, is a turn).  Turns must hold longer than
+# SLOWTURNTICS (10) so Doom switches to full-speed turning.
+BTN_CASES = [
+    pytest.param("btn_l2", _set_default, UboKey.LEFT, True, id="l2-default"),
+    pytest.param("btn_l2", _set_in_level, UboKey.LEFT, True, id="l2-in_level"),
+    pytest.param("btn_l2", _set_menu_open, UboKey.LEFT, True, id="l2-menu"),
+    pytest.param("btn_l2", _set_alt_mode, UboKey.USE, False, id="l2-alt"),
+    pytest.param("btn_l3", _set_default, UboKey.RIGHT, True, id="l3-default"),
+    pytest.param("btn_l3", _set_in_level, UboKey.RIGHT, True, id="l3-in_level"),
+    pytest.param("btn_l3", _set_menu_open, UboKey.MENU_SELECT, False, id="l3-menu"),
+    pytest.param("btn_l3", _set_alt_mode, UboKey.ESCAPE, False, id="l3-alt"),
+]
+
+NON_LEVEL_STATES = [
+    pytest.param(_set_dead, id="dead"),
+    pytest.param(_set_menu_open, id="menu"),
+    pytest.param(_set_intermission, id="intermission"),
+]
+
+# update_game_state() transitions: (prior states, final (alive, gamestate,
+# menuactive), whether the final update reports "just left a level").
+LEFT_LEVEL_CASES = [
+    pytest.param((), (True, GS_INTERMISSION, False), False, id="never_in_level"),
+    pytest.param((), (True, GS_LEVEL, False), False, id="entering_level"),
+    pytest.param((_set_in_level,), (True, GS_LEVEL, False), False, id="staying_in_level"),
+    pytest.param((_set_in_level,), (True, GS_INTERMISSION, False), True, id="to_intermission"),
+    pytest.param((_set_in_level,), (True, GS_LEVEL, True), True, id="to_menu"),
+    pytest.param((_set_in_level,), (False, GS_LEVEL, False), True, id="engine_dies"),
+    pytest.param(
+        (_set_in_level, _set_intermission),
+        (True, GS_INTERMISSION, False),
+        False,
+        id="already_left",
+    ),
+]
+
+TOGGLE_NOOP_STATES = [pytest.param(_set_default, id="default"), *NON_LEVEL_STATES]
+
+
 # ------------------------------------------------------------------ #
 # go_up / go_down — always forward/backward, no state dependency
 # ------------------------------------------------------------------ #
 
 class TestMovement:
-    def test_go_up_always_sends_up(self, ctrl: DoomController, rec: Recorder) -> None:
-        ctrl.go_up()
-        assert rec.last_key is UboKey.UP
-
-    def test_go_up_hold_is_8_ticks(self, ctrl: DoomController, rec: Recorder) -> None:
-        ctrl.go_up()
-        assert rec.last_hold == 8
-
-    def test_go_down_always_sends_down(self, ctrl: DoomController, rec: Recorder) -> None:
-        ctrl.go_down()
-        assert rec.last_key is UboKey.DOWN
-
-    def test_go_down_hold_is_8_ticks(self, ctrl: DoomController, rec: Recorder) -> None:
-        ctrl.go_down()
+    @pytest.mark.parametrize("setup", MOVEMENT_STATES)
+    @pytest.mark.parametrize(
+        "action,key",
+        [
+            pytest.param("go_up", UboKey.UP, id="go_up"),
+            pytest.param("go_down", UboKey.DOWN, id="go_down"),
+        ],
+    )
+    def test_sends_fixed_key_and_hold(
+        self,
+        ctrl: DoomController,
+        rec: Recorder,
+        setup: StateSetup,
+        action: str,
+        key: UboKey,
+    ) -> None:
+        """UP/DOWN map straight to forward/backward for 8 ticks in every state."""
+        setup(ctrl)
+        getattr(ctrl, action)()
+        assert rec.last_key is key
         assert rec.last_hold == 8
 
-    def test_go_up_ignores_alt_mode(self, ctrl: DoomController, rec: Recorder) -> None:
-        _set_in_level(ctrl)
-        ctrl.toggle_mode()  # enable ALT
-        ctrl.go_up()
-        assert rec.last_key is UboKey.UP
-
-    def test_go_down_ignores_alt_mode(self, ctrl: DoomController, rec: Recorder) -> None:
-        _set_in_level(ctrl)
-        ctrl.toggle_mode()
-        ctrl.go_down()
-        assert rec.last_key is UboKey.DOWN
-
-    def test_go_up_ignores_menu_state(self, ctrl: DoomController, rec: Recorder) -> None:
-        _set_menu_open(ctrl)
-        ctrl.go_up()
-        assert rec.last_key is UboKey.UP
-
-    def test_go_down_ignores_menu_state(self, ctrl: DoomController, rec: Recorder) -> None:
-        _set_menu_open(ctrl)
-        ctrl.go_down()
-        assert rec.last_key is UboKey.DOWN
-
 
 # ------------------------------------------------------------------ #
 # go_back routing
@@ -133,9 +223,9 @@ class TestGoBack:
         ctrl.go_back()
         assert rec.last_key is UboKey.FIRE
 
-    def test_in_level_absorbs_event(self, ctrl: DoomController, rec: Recorder) -> None:
+    def test_in_level_absorbs_event(self, ctrl: DoomController) -> None:
         _set_in_level(ctrl)
-        assert ctrl.go_back() is True
+        assert ctrl.go_back()
 
     def test_menu_active_sends_menu_select(self, ctrl: DoomController, rec: Recorder) -> None:
         """Menu open: BACK confirms/selects — allows BACK×N navigation to start a game."""
@@ -143,9 +233,9 @@ class TestGoBack:
         ctrl.go_back()
         assert rec.last_key is UboKey.MENU_SELECT
 
-    def test_menu_active_absorbs_event(self, ctrl: DoomController, rec: Recorder) -> None:
+    def test_menu_active_absorbs_event(self, ctrl: DoomController) -> None:
         _set_menu_open(ctrl)
-        assert ctrl.go_back() is True
+        assert ctrl.go_back()
 
     def test_title_screen_sends_escape(self, ctrl: DoomController, rec: Recorder) -> None:
         """Title/demo screen (menu_active=False, in_level=False): ESCAPE opens main menu."""
@@ -157,144 +247,84 @@ class TestGoBack:
         ctrl.go_back()
         assert rec.last_key is UboKey.ESCAPE
 
-    def test_always_returns_true(self, ctrl: DoomController, rec: Recorder) -> None:
+    @pytest.mark.parametrize("setup", BACK_STATES)
+    def test_always_returns_true(self, ctrl: DoomController, setup: StateSetup) -> None:
         """go_back must return True in every state so ubo doesn't close the page."""
-        for setup in [
-            lambda: None,
-            lambda: _set_in_level(ctrl),
-            lambda: _set_menu_open(ctrl),
-            lambda: _set_intermission(ctrl),
-        ]:
-            setup()
-            assert ctrl.go_back() is True, (
-                f"go_back() returned False: in_level={ctrl.in_level} menu={ctrl.menu_active}"
-            )
+        setup(ctrl)
+        assert ctrl.go_back()
 
     def test_in_level_fire_not_menu_select(self, ctrl: DoomController, rec: Recorder) -> None:
         """Regression: in-level BACK must be FIRE, not a menu action."""
         _set_in_level(ctrl)
-        ctrl.go_back()
-        assert rec.last_key is not UboKey.MENU_SELECT
+        assert _back_key(ctrl, rec) is not UboKey.MENU_SELECT
 
     def test_in_level_fire_not_escape(self, ctrl: DoomController, rec: Recorder) -> None:
         """Regression: in-level BACK must not send ESCAPE (would open menu mid-game)."""
         _set_in_level(ctrl)
-        ctrl.go_back()
-        assert rec.last_key is not UboKey.ESCAPE
-
-
-# ------------------------------------------------------------------ #
-# btn_l2 routing
-# ------------------------------------------------------------------ #
-
-class TestBtnL2:
-    def test_normal_mode_turns_left(self, ctrl: DoomController, rec: Recorder) -> None:
-        _set_in_level(ctrl)
-        ctrl.btn_l2()
-        assert rec.last_key is UboKey.LEFT
-
-    def test_normal_mode_hold_exceeds_slowturntics(self, ctrl: DoomController, rec: Recorder) -> None:
-        # SLOWTURNTICS = 10; hold must be > 10 for full-speed turning.
-        ctrl.btn_l2()
-        assert rec.last_hold > 10
-
-    def test_alt_mode_sends_use(self, ctrl: DoomController, rec: Recorder) -> None:
-        _set_in_level(ctrl)
-        ctrl.toggle_mode()
-        ctrl.btn_l2()
-        assert rec.last_key is UboKey.USE
-
-    def test_alt_mode_not_left(self, ctrl: DoomController, rec: Recorder) -> None:
-        _set_in_level(ctrl)
-        ctrl.toggle_mode()
-        ctrl.btn_l2()
-        assert rec.last_key is not UboKey.LEFT
+        assert _back_key(ctrl, rec) is not UboKey.ESCAPE
 
 
 # ------------------------------------------------------------------ #
-# btn_l3 routing
+# btn_l2 / btn_l3 routing
 # ------------------------------------------------------------------ #
 
-class TestBtnL3:
-    def test_normal_in_level_turns_right(self, ctrl: DoomController, rec: Recorder) -> None:
-        _set_in_level(ctrl)
-        ctrl.btn_l3()
-        assert rec.last_key is UboKey.RIGHT
-
-    def test_normal_in_level_hold_exceeds_slowturntics(self, ctrl: DoomController, rec: Recorder) -> None:
-        _set_in_level(ctrl)
-        ctrl.btn_l3()
-        assert rec.last_hold > 10
-
-    def test_normal_menu_active_sends_menu_select(self, ctrl: DoomController, rec: Recorder) -> None:
-        _set_menu_open(ctrl)
-        ctrl.btn_l3()
-        assert rec.last_key is UboKey.MENU_SELECT
-
-    def test_alt_mode_sends_escape(self, ctrl: DoomController, rec: Recorder) -> None:
-        _set_in_level(ctrl)
-        ctrl.toggle_mode()
-        ctrl.btn_l3()
-        assert rec.last_key is UboKey.ESCAPE
+class TestShoulderButtons:
+    @pytest.mark.parametrize("btn,setup,key,turn", BTN_CASES)
+    def test_routing(
+        self,
+        ctrl: DoomController,
+        rec: Recorder,
+        btn: str,
+        setup: StateSetup,
+        key: UboKey,
+        turn: bool,
+    ) -> None:
+        setup(ctrl)
+        getattr(ctrl, btn)()
+        assert rec.last_key is key
+        if turn:
+            assert rec.last_hold > 10
 
-    def test_alt_mode_ignores_menu_active(self, ctrl: DoomController, rec: Recorder) -> None:
+    def test_l3_alt_mode_ignores_menu_active(self, ctrl: DoomController, rec: Recorder) -> None:
         """
         Regression: in ALT mode, btn_l3 must send ESCAPE even if menu is active.
         The alt_mode branch must short-circuit before the menu_active branch.
         """
-        # Force alt_mode=True while menu is active:
         # ALT mode can only be set in-level, so: enter level → toggle → open menu
-        _set_in_level(ctrl)
-        ctrl.toggle_mode()          # now alt_mode=True
+        _set_alt_mode(ctrl)
         _set_menu_open(ctrl)        # now menu_active=True, but alt_mode stays True
         ctrl.btn_l3()
         assert rec.last_key is UboKey.ESCAPE
 
-    def test_default_state_sends_right(self, ctrl: DoomController, rec: Recorder) -> None:
-        # No state updates: not alive, not in level, no menu
-        ctrl.btn_l3()
-        assert rec.last_key is UboKey.RIGHT
-
 
 # ------------------------------------------------------------------ #
 # toggle_mode
 # ------------------------------------------------------------------ #
 
 class TestToggleMode:
-    def test_no_op_when_not_in_level(self, ctrl: DoomController) -> None:
-        result = ctrl.toggle_mode()
-        assert result is False
-        assert ctrl.alt_mode is False
-
-    def test_no_op_during_menu(self, ctrl: DoomController) -> None:
-        _set_menu_open(ctrl)
-        result = ctrl.toggle_mode()
-        assert result is False
-        assert ctrl.alt_mode is False
-
-    def test_no_op_during_intermission(self, ctrl: DoomController) -> None:
-        _set_intermission(ctrl)
-        result = ctrl.toggle_mode()
-        assert result is False
-        assert ctrl.alt_mode is False
+    @pytest.mark.parametrize("setup", TOGGLE_NOOP_STATES)
+    def test_no_op_outside_level(self, ctrl: DoomController, setup: StateSetup) -> None:
+        setup(ctrl)
+        assert not ctrl.toggle_mode()
+        assert not ctrl.alt_mode
 
     def test_enables_alt_mode_in_level(self, ctrl: DoomController) -> None:
         _set_in_level(ctrl)
         result = ctrl.toggle_mode()
-        assert result is True
-        assert ctrl.alt_mode is True
+        assert result
+        assert ctrl.alt_mode
 
     def test_disables_alt_mode_in_level(self, ctrl: DoomController) -> None:
         _set_in_level(ctrl)
         ctrl.toggle_mode()  # on
         result = ctrl.toggle_mode()  # off
-        assert result is True
-        assert ctrl.alt_mode is False
+        assert result
+        assert not ctrl.alt_mode
 
     def test_does_not_emit_key(self, ctrl: DoomController, rec: Recorder) -> None:
         _set_in_level(ctrl)
         ctrl.toggle_mode()
-        assert rec.calls == []
+        assert len(rec) == 0
 
 
 # ------------------------------------------------------------------ #
@@ -304,23 +334,23 @@ class TestToggleMode:
 class TestExitLevel:
     def test_no_op_when_alt_mode_false(self, ctrl: DoomController) -> None:
         result = ctrl.exit_level()
-        assert result is False
-        assert ctrl.alt_mode is False
+        assert not result
+        assert not ctrl.alt_mode
 
     def test_resets_alt_mode_when_active(self, ctrl: DoomController) -> None:
         _set_in_level(ctrl)
         ctrl.toggle_mode()
-        assert ctrl.alt_mode is True
+        assert ctrl.alt_mode
         result = ctrl.exit_level()
-        assert result is True
-        assert ctrl.alt_mode is False
+        assert result
+        assert not ctrl.alt_mode
 
     def test_does_not_emit_key(self, ctrl: DoomController, rec: Recorder) -> None:
         _set_in_level(ctrl)
         ctrl.toggle_mode()
         rec.clear()
         ctrl.exit_level()
-        assert rec.calls == []
+        assert len(rec) == 0
 
 
 # ------------------------------------------------------------------ #
@@ -330,74 +360,68 @@ class TestExitLevel:
 class TestUpdateGameState:
     def test_dead_engine_clears_everything(self, ctrl: DoomController) -> None:
         ctrl.update_game_state(alive=False, gamestate=GS_LEVEL, menuactive=True)
-        assert ctrl.in_level is False
-        assert ctrl.menu_active is False
+        assert not ctrl.in_level
+        assert not ctrl.menu_active
 
     def test_alive_in_level_no_menu(self, ctrl: DoomController) -> None:
         ctrl.update_game_state(alive=True, gamestate=GS_LEVEL, menuactive=False)
-        assert ctrl.in_level is True
-        assert ctrl.menu_active is False
+        assert ctrl.in_level
+        assert not ctrl.menu_active
 
     def test_alive_in_level_menu_open(self, ctrl: DoomController) -> None:
         """Menu overlay on GS_LEVEL: in_level must be False (menu takes priority)."""
         ctrl.update_game_state(alive=True, gamestate=GS_LEVEL, menuactive=True)
-        assert ctrl.in_level is False
-        assert ctrl.menu_active is True
+        assert not ctrl.in_level
+        assert ctrl.menu_active
 
-    def test_alive_in_level_menu_mutually_exclusive(self, ctrl: DoomController) -> None:
+    @pytest.mark.parametrize("alive,gs,menu", GAME_STATE_CASES)
+    def test_alive_in_level_menu_mutually_exclusive(
+        self, ctrl: DoomController, alive: bool, gs: int, menu: bool
+    ) -> None:
         """in_level and menu_active can never both be True simultaneously."""
-        for alive in (True, False):
-            for gs in (GS_LEVEL, GS_INTERMISSION, GS_FINALE, GS_DEMOSCREEN):
-                for menu in (True, False):
-                    ctrl.update_game_state(alive=alive, gamestate=gs, menuactive=menu)
-                    assert not (ctrl.in_level and ctrl.menu_active), (
-                        f"Both True: alive={alive} gs={gs} menu={menu}"
-                    )
+        ctrl.update_game_state(alive=alive, gamestate=gs, menuactive=menu)
+        assert not (ctrl.in_level and ctrl.menu_active)
 
     def test_intermission_not_in_level(self, ctrl: DoomController) -> None:
         ctrl.update_game_state(alive=True, gamestate=GS_INTERMISSION, menuactive=False)
-        assert ctrl.in_level is False
+        assert not ctrl.in_level
 
     def test_demoscreen_not_in_level(self, ctrl: DoomController) -> None:
         ctrl.update_game_state(alive=True, gamestate=GS_DEMOSCREEN, menuactive=False)
-        assert ctrl.in_level is False
+        assert not ctrl.in_level
 
     # -- just-left-level return value --
 
-    def test_returns_false_when_never_in_level(self, ctrl: DoomController) -> None:
-        result = ctrl.update_game_state(alive=True, gamestate=GS_INTERMISSION, menuactive=False)
-        assert result is False
-
-    def test_returns_false_when_entering_level(self, ctrl: DoomController) -> None:
-        # Transition: not-in-level → in-level
-        result = ctrl.update_game_state(alive=True, gamestate=GS_LEVEL, menuactive=False)
-        assert result is False
-
-    def test_returns_false_when_staying_in_level(self, ctrl: DoomController) -> None:
-        ctrl.update_game_state(alive=True, gamestate=GS_LEVEL, menuactive=False)
-        result = ctrl.update_game_state(alive=True, gamestate=GS_LEVEL, menuactive=False)
-        assert result is False
+    @pytest.mark.parametrize("priors,final,left", LEFT_LEVEL_CASES)
+    def test_returns_true_only_when_leaving_level(
+        self,
+        ctrl: DoomController,
+        priors: tuple[StateSetup, ...],
+        final: tuple[bool, int, bool],
+        left: bool,
+    ) -> None:
+        for setup in priors:
+            setup(ctrl)
+        alive, gs, menu = final
+        assert ctrl.update_game_state(alive=alive, gamestate=gs, menuactive=menu) is left
 
-    def test_returns_true_when_leaving_level_to_intermission(self, ctrl: DoomController) -> None:
-        ctrl.update_game_state(alive=True, gamestate=GS_LEVEL, menuactive=False)
-        result = ctrl.update_game_state(alive=True, gamestate=GS_INTERMISSION, menuactive=False)
-        assert result is True
 
-    def test_returns_true_when_leaving_level_to_menu(self, ctrl: DoomController) -> None:
-        ctrl.update_game_state(alive=True, gamestate=GS_LEVEL, menuactive=False)
-        result = ctrl.update_game_state(alive=True, gamestate=GS_LEVEL, menuactive=True)
-        assert result is True
+# ------------------------------------------------------------------ #
+# reset
+# ------------------------------------------------------------------ #
 
-    def test_returns_true_when_engine_dies_mid_level(self, ctrl: DoomController) -> None:
-        ctrl.update_game_state(alive=True, gamestate=GS_LEVEL, menuactive=False)
-        result = ctrl.update_game_state(alive=False, gamestate=GS_LEVEL, menuactive=False)
-        assert result is True
+class TestReset:
+    def test_clears_level_menu_and_alt_mode(self, ctrl: DoomController) -> None:
+        _set_in_level(ctrl)
+        ctrl.toggle_mode()
+        _set_menu_open(ctrl)
+        ctrl.reset()
+        assert (ctrl.in_level, ctrl.menu_active, ctrl.alt_mode) == (False, False, False)
 
-    def test_returns_false_after_already_left(self, ctrl: DoomController) -> None:
-        ctrl.update_game_state(alive=True, gamestate=GS_LEVEL, menuactive=False)
-        ctrl.update_game_state(alive=True, gamestate=GS_INTERMISSION, menuactive=False)
-        result = ctrl.update_game_state(alive=True, gamestate=GS_INTERMISSION, menuactive=False)
-        assert result is False
+    def test_keeps_tap_fn(self, ctrl: DoomController, rec: Recorder) -> None:
+        ctrl.reset()
+        ctrl.go_back()
+        assert rec.last_key is UboKey.ESCAPE
 
 
 # ------------------------------------------------------------------ #
@@ -424,20 +448,14 @@ class TestPingPongRegression:
     ) -> None:
         """Simulate the BACK×3 workflow: title→ESCAPE, then menus→MENU_SELECT."""
         # Step 1: title screen
-        rec.clear()
-        ctrl.go_back()
-        assert rec.last_key is UboKey.ESCAPE
+        assert _back_key(ctrl, rec) is UboKey.ESCAPE
 
         # Step 2: menu is now open (tick thread would set this after doom.tick())
         ctrl.update_game_state(alive=True, gamestate=GS_LEVEL, menuactive=True)
-        rec.clear()
-        ctrl.go_back()
-        assert rec.last_key is UboKey.MENU_SELECT  # confirm New Game
+        assert _back_key(ctrl, rec) is UboKey.MENU_SELECT  # confirm New Game
 
         # Step 3: still in menu (episode select)
-        rec.clear()
-        ctrl.go_back()
-        assert rec.last_key is UboKey.MENU_SELECT  # confirm episode
+        assert _back_key(ctrl, rec) is UboKey.MENU_SELECT  # confirm episode
 
     def test_repeated_go_back_in_menu_always_menu_selects(
         self, ctrl: DoomController, rec: Recorder
@@ -445,31 +463,21 @@ class TestPingPongRegression:
         """Once the menu is open, every BACK should confirm — no ESCAPE mixed in."""
         _set_menu_open(ctrl)
         for _ in range(10):
-            rec.clear()
-            ctrl.go_back()
-            assert rec.last_key is UboKey.MENU_SELECT, (
-                f"Expected MENU_SELECT in open menu, got {rec.last_key} (ping-pong bug)"
-            )
+            assert _back_key(ctrl, rec) is UboKey.MENU_SELECT, "ping-pong bug"
 
     def test_repeated_go_back_on_title_screen_always_escapes(
         self, ctrl: DoomController, rec: Recorder
     ) -> None:
         """Title screen with no menu: BACK must always send ESCAPE, never MENU_SELECT."""
         for _ in range(10):
-            rec.clear()
-            ctrl.go_back()
-            assert rec.last_key is UboKey.ESCAPE, (
-                f"Expected ESCAPE on title screen, got {rec.last_key}"
-            )
+            assert _back_key(ctrl, rec) is UboKey.ESCAPE
 
     def test_repeated_go_back_in_level_always_fires(
         self, ctrl: DoomController, rec: Recorder
     ) -> None:
         _set_in_level(ctrl)
         for _ in range(10):
-            rec.clear()
-            ctrl.go_back()
-            assert rec.last_key is UboKey.FIRE
+            assert _back_key(ctrl, rec) is UboKey.FIRE
 
 
 # ------------------------------------------------------------------ #
@@ -477,34 +485,30 @@ class TestPingPongRegression:
 # ------------------------------------------------------------------ #
 
 class TestAltModeLifecycle:
-    def test_alt_mode_set_only_in_level(self, ctrl: DoomController) -> None:
+    @pytest.mark.parametrize("setup", NON_LEVEL_STATES)
+    def test_alt_mode_set_only_in_level(self, ctrl: DoomController, setup: StateSetup) -> None:
         """ALT mode must be off outside of active gameplay."""
-        for setup in [
-            lambda: ctrl.update_game_state(alive=False, gamestate=-1, menuactive=False),
-            lambda: _set_menu_open(ctrl),
-            lambda: _set_intermission(ctrl),
-        ]:
-            setup()
-            ctrl.toggle_mode()
-            assert ctrl.alt_mode is False, "ALT mode enabled outside in-level state"
+        setup(ctrl)
+        ctrl.toggle_mode()
+        assert not ctrl.alt_mode
 
     def test_alt_mode_persists_within_level(self, ctrl: DoomController) -> None:
         _set_in_level(ctrl)
         ctrl.toggle_mode()
-        assert ctrl.alt_mode is True
+        assert ctrl.alt_mode
         # Another tick in-level: state unchanged
         _set_in_level(ctrl)
-        assert ctrl.alt_mode is True
+        assert ctrl.alt_mode
 
     def test_alt_mode_cleared_on_level_exit(self, ctrl: DoomController) -> None:
         _set_in_level(ctrl)
         ctrl.toggle_mode()
-        assert ctrl.alt_mode is True
+        assert ctrl.alt_mode
         # Simulate leaving level
         just_left = ctrl.update_game_state(alive=True, gamestate=GS_INTERMISSION, menuactive=False)
-        assert just_left is True
+        assert just_left
         ctrl.exit_level()   # DoomPage calls this on the main thread
-        assert ctrl.alt_mode is False
+        assert not ctrl.alt_mode
 
     def test_alt_mode_not_reopenable_during_intermission(self, ctrl: DoomController) -> None:
         _set_in_level(ctrl)
@@ -512,12 +516,12 @@ class TestAltModeLifecycle:
         ctrl.update_game_state(alive=True, gamestate=GS_INTERMISSION, menuactive=False)
         ctrl.exit_level()
         ctrl.toggle_mode()   # should be a no-op
-        assert ctrl.alt_mode is False
+        assert not ctrl.alt_mode
 
     def test_alt_mode_cleared_on_engine_death(self, ctrl: DoomController) -> None:
         _set_in_level(ctrl)
         ctrl.toggle_mode()
         just_left = ctrl.update_game_state(alive=False, gamestate=-1, menuactive=False)
-        assert just_left is True
+        assert just_left
         ctrl.exit_level()
-        assert ctrl.alt_mode is False
+        assert not ctrl.alt_mode
@@ -0,0 +1,169 @@
+"""
+tests/test_doom_lib.py
+
+Unit tests for the DoomLib ctypes wrapper.
+
+No .so required: ctypes.CDLL is replaced by FakeLib, which exposes only the
+exports a test gives it and records every call.
+"""
+
+from __future__ import annotations
+
+import ctypes
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from native import doom_lib
+from native.doom_lib import DOOM_API_VERSION, KEY_BATCH_MAX, DoomLib, UboKey
+
+# ------------------------------------------------------------------ #
+# Helper / fixtures
+# ------------------------------------------------------------------ #
+
+# Every export DoomLib binds, with the value each fake returns.
+EXPORTS: dict[str, Any] = {
+    "doom_api_version": DOOM_API_VERSION,
+    "doom_init": 0,
+    "doom_tick": 1,
+    "doom_shutdown": None,
+    "doom_key_down": None,
+    "doom_key_up": None,
+    "doom_post_keys": 0,
+    "doom_is_alive": 1,
+    "doom_reset": None,
+    "doom_get_gamestate": 0,
+    "doom_get_menuactive": 0,
+    "doom_get_rgba_ptr": None,
+    "doom_get_rgba_width": 320,
+    "doom_get_rgba_height": 200,
+    "doom_get_rgb565_be": 0,
+}
+
+
+class FakeFn:
+    """Stands in for a ctypes function pointer: settable argtypes/restype."""
+
+    def __init__(self, ret: Any) -> None:
+        self.ret = ret
+        self.calls: list[tuple[Any, ...]] = []
+        self.argtypes: list[Any] = []
+        self.restype: Any = None
+
+    def __call__(self, *args: Any) -> Any:
+        self.calls.append(args)
+        return self.ret
+
+
+class PostKeysFn(FakeFn):
+    """doom_post_keys stand-in: snapshots each batch, since DoomLib reuses the buffer."""
+
+    def __call__(self, events: ctypes.Array, n: int) -> Any:
+        self.calls.append(tuple(events[:n]))
+        return self.ret
+
+
+class FakeLib:
+    def __init__(self, exports: dict[str, Any]) -> None:
+        for name, ret in exports.items():
+            setattr(self, name, ret if isinstance(ret, FakeFn) else FakeFn(ret))
+
+
+@pytest.fixture
+def lib_path(tmp_path: Path) -> Path:
+    path = tmp_path / "libubodoom.so"
+    path.touch()
+    return path
+
+
+# Override value that removes an export, as in a library built from an older tree.
+MISSING = object()
+
+
+def _load(monkeypatch: pytest.MonkeyPatch, lib_path: Path, **overrides: Any) -> DoomLib:
+    """Build a DoomLib over a FakeLib with *overrides* applied to EXPORTS."""
+    exports = {**EXPORTS, **overrides}
+    fake = FakeLib({name: ret for name, ret in exports.items() if ret is not MISSING})
+    monkeypatch.setattr(doom_lib.ctypes, "CDLL", lambda _path: fake)
+    return DoomLib(lib_path)
+
+
+# ------------------------------------------------------------------ #
+# ABI version gate
+# ------------------------------------------------------------------ #
+
+class TestApiVersion:
+    def test_matching_version_loads(self, monkeypatch: pytest.MonkeyPatch, lib_path: Path) -> None:
+        doom = _load(monkeypatch, lib_path)
+        assert doom._lib.doom_tick.restype is ctypes.c_int
+
+    def test_missing_version_export_rejected(
+        self, monkeypatch: pytest.MonkeyPatch, lib_path: Path
+    ) -> None:
+        with pytest.raises(RuntimeError, match="predates doom_api_version"):
+            _load(monkeypatch, lib_path, doom_api_version=MISSING)
+
+    def test_other_version_rejected(self, monkeypatch: pytest.MonkeyPatch, lib_path: Path) -> None:
+        with pytest.raises(RuntimeError, match=f"API {DOOM_API_VERSION + 1}, expected"):
+            _load(monkeypatch, lib_path, doom_api_version=DOOM_API_VERSION + 1)
+
+    def test_tick_reports_alive_flag(self, monkeypatch: pytest.MonkeyPatch, lib_path: Path) -> None:
+        assert _load(monkeypatch, lib_path).tick()
+        assert not _load(monkeypatch, lib_path, doom_tick=0).tick()
+
+
+# ------------------------------------------------------------------ #
+# Return codes
+# ------------------------------------------------------------------ #
+
+class TestReturnCodes:
+    def test_post_keys_raises_on_failure(
+        self, monkeypatch: pytest.MonkeyPatch, lib_path: Path
+    ) -> None:
+        doom = _load(monkeypatch, lib_path, doom_post_keys=-1)
+        with pytest.raises(RuntimeError, match="doom_post_keys failed rc=-1"):
+            doom.post_keys([1])
+
+    def test_rgb565_be_into_raises_on_failure(
+        self, monkeypatch: pytest.MonkeyPatch, lib_path: Path
+    ) -> None:
+        doom = _load(monkeypatch, lib_path, doom_get_rgb565_be=-1)
+        with pytest.raises(RuntimeError, match="doom_get_rgb565_be failed rc=-1"):
+            doom.rgb565_be_into(0, 240, 240, 45)
+
+
+# ------------------------------------------------------------------ #
+# post_keys batching
+# ------------------------------------------------------------------ #
+
+class TestPostKeys:
+    def _post(
+        self, monkeypatch: pytest.MonkeyPatch, lib_path: Path, events: list[int]
+    ) -> list[tuple[int, ...]]:
+        post = PostKeysFn(0)
+        _load(monkeypatch, lib_path, doom_post_keys=post).post_keys(events)
+        return post.calls
+
+    def test_empty_makes_no_call(self, monkeypatch: pytest.MonkeyPatch, lib_path: Path) -> None:
+        assert self._post(monkeypatch, lib_path, []) == []
+
+    def test_down_positive_up_negative(
+        self, monkeypatch: pytest.MonkeyPatch, lib_path: Path
+    ) -> None:
+        events = [UboKey.UP, -UboKey.FIRE, UboKey.MENU_SELECT, -UboKey.UP]
+        assert self._post(monkeypatch, lib_path, events) == [(1, -5, 8, -1)]
+
+    def test_one_call_per_full_batch(self, monkeypatch: pytest.MonkeyPatch, lib_path: Path) -> None:
+        events = [UboKey.LEFT] * KEY_BATCH_MAX
+        assert self._post(monkeypatch, lib_path, events) == [tuple(events)]
+
+    def test_order_kept_across_batch_boundary(
+        self, monkeypatch: pytest.MonkeyPatch, lib_path: Path
+    ) -> None:
+        # KEY_BATCH_MAX + 6 events cycling through every key with alternating
+        # down/up signs, so any reordering across the boundary shows up.
+        events = [(i % 8 + 1) * (1 if i % 2 == 0 else -1) for i in range(KEY_BATCH_MAX + 6)]
+        calls = self._post(monkeypatch, lib_path, events)
+        assert [len(c) for c in calls] == [KEY_BATCH_MAX, 6]
+        assert [e for c in calls for e in c] == events
@@ -0,0 +1,166 @@
+"""
+tests/test_doom_tick.py
+
+Unit tests for the doom-tick thread helpers in doom_tick.py.
+
+No Kivy, no .so, no ubo_app imports required.
+"""
+
+from __future__ import annotations
+
+import queue
+
+import pytest
+
+import doom_tick
+from doom_tick import (
+    TICK_FIFO_PRIORITY,
+    TICK_NICE,
+    TICK_SCHED_MODES,
+    coalesce_taps,
+    drain_queue,
+    raise_tick_priority,
+    validate_tick_sched,
+)
+from native.doom_lib import UboKey
+
+Taps = list[tuple[UboKey, int]]
+
+# ------------------------------------------------------------------ #
+# drain_queue
+# ------------------------------------------------------------------ #
+
+class TestDrainQueue:
+    def test_empty_queue(self) -> None:
+        q: queue.Queue[tuple[UboKey, int]] = queue.Queue()
+        assert drain_queue(q) == []
+
+    def test_takes_all_items_in_order_and_empties(self) -> None:
+        q: queue.Queue[tuple[UboKey, int]] = queue.Queue()
+        taps = [(UboKey.UP, 8), (UboKey.FIRE, 2), (UboKey.UP, 8)]
+        for tap in taps:
+            q.put_nowait(tap)
+        assert drain_queue(q) == taps
+        assert q.empty()
+        assert drain_queue(q) == []
+
+
+# ------------------------------------------------------------------ #
+# coalesce_taps
+# ------------------------------------------------------------------ #
+
+COALESCE_CASES = [
+    pytest.param([], [], id="empty"),
+    pytest.param([(UboKey.FIRE, 2)], [(UboKey.FIRE, 2)], id="single"),
+    # Repeats: one entry per key, longest hold, first-occurrence position.
+    pytest.param([(UboKey.UP, 8), (UboKey.UP, 8)], [(UboKey.UP, 8)], id="repeat"),
+    pytest.param([(UboKey.LEFT, 2), (UboKey.LEFT, 12)], [(UboKey.LEFT, 12)], id="repeat_longest_hold"),
+    pytest.param(
+        [(UboKey.FIRE, 2), (UboKey.USE, 2), (UboKey.FIRE, 2)],
+        [(UboKey.FIRE, 2), (UboKey.USE, 2)],
+        id="repeat_keeps_first_position",
+    ),
+    # Opposite directions: the later one wins, the earlier is dropped.
+    pytest.param([(UboKey.UP, 8), (UboKey.DOWN, 8)], [(UboKey.DOWN, 8)], id="up_then_down"),
+    pytest.param([(UboKey.DOWN, 8), (UboKey.UP, 8)], [(UboKey.UP, 8)], id="down_then_up"),
+    pytest.param(
+        [(UboKey.UP, 8), (UboKey.DOWN, 8), (UboKey.UP, 8)],
+        [(UboKey.UP, 8)],
+        id="up_down_up",
+    ),
+    pytest.param(
+        [(UboKey.UP, 8), (UboKey.FIRE, 2), (UboKey.DOWN, 8)],
+        [(UboKey.FIRE, 2), (UboKey.DOWN, 8)],
+        id="cancel_keeps_other_keys",
+    ),
+    # Non-movement keys never cancel each other.
+    pytest.param(
+        [(UboKey.LEFT, 12), (UboKey.RIGHT, 12)],
+        [(UboKey.LEFT, 12), (UboKey.RIGHT, 12)],
+        id="turns_not_cancelled",
+    ),
+    # Menu keys: opening the menu must still come before the selection.
+    pytest.param(
+        [(UboKey.ESCAPE, 2), (UboKey.MENU_SELECT, 2), (UboKey.ESCAPE, 2)],
+        [(UboKey.ESCAPE, 2), (UboKey.MENU_SELECT, 2)],
+        id="escape_select_escape",
+    ),
+    pytest.param(
+        [(UboKey.ESCAPE, 2), (UboKey.FIRE, 2), (UboKey.ESCAPE, 2)],
+        [(UboKey.ESCAPE, 2), (UboKey.FIRE, 2)],
+        id="escape_fire_escape",
+    ),
+    pytest.param(
+        [(UboKey.MENU_SELECT, 2), (UboKey.DOWN, 8), (UboKey.MENU_SELECT, 2)],
+        [(UboKey.MENU_SELECT, 2), (UboKey.DOWN, 8)],
+        id="select_move_select",
+    ),
+]
+
+
+class TestCoalesceTaps:
+    @pytest.mark.parametrize("events,expected", COALESCE_CASES)
+    def test_table(self, events: Taps, expected: Taps) -> None:
+        assert coalesce_taps(events) == expected
+
+
+# ------------------------------------------------------------------ #
+# Tick-thread scheduling (UBO_DOOM_TICK_SCHED)
+# ------------------------------------------------------------------ #
+
+@pytest.fixture
+def syscalls(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, int]]:
+    """Record sched_setscheduler/nice calls instead of changing our priority."""
+    calls: list[tuple[str, int]] = []
+    monkeypatch.setattr(
+        doom_tick.os,
+        "sched_setscheduler",
+        lambda _pid, _policy, param: calls.append(("fifo", param.sched_priority)),
+    )
+    monkeypatch.setattr(doom_tick.os, "nice", lambda inc: calls.append(("nice", inc)))
+    return calls
+
+
+def _deny(*_args: object) -> None:
+    raise PermissionError("Operation not permitted")
+
+
+class TestTickSched:
+    @pytest.mark.parametrize("mode", TICK_SCHED_MODES)
+    def test_known_modes_accepted(self, mode: str) -> None:
+        validate_tick_sched(mode)
+
+    @pytest.mark.parametrize("mode", ["", "realtime", "FIFO"])
+    def test_unknown_mode_rejected(self, mode: str) -> None:
+        with pytest.raises(ValueError, match="UBO_DOOM_TICK_SCHED"):
+            validate_tick_sched(mode)
+
+    def test_off_makes_no_syscall(self, syscalls: list[tuple[str, int]]) -> None:
+        raise_tick_priority("off")
+        assert syscalls == []
+
+    def test_nice(self, syscalls: list[tuple[str, int]]) -> None:
+        raise_tick_priority("nice")
+        assert syscalls == [("nice", TICK_NICE)]
+
+    def test_fifo(self, syscalls: list[tuple[str, int]]) -> None:
+        raise_tick_priority("fifo")
+        assert syscalls == [("fifo", TICK_FIFO_PRIORITY)]
+
+    def test_fifo_denied_falls_back_to_nice(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        syscalls: list[tuple[str, int]],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        monkeypatch.setattr(doom_tick.os, "sched_setscheduler", _deny)
+        raise_tick_priority("fifo")
+        assert syscalls == [("nice", TICK_NICE)]
+        assert "SCHED_FIFO unavailable" in capsys.readouterr().out
+
+    def test_nice_denied_is_not_fatal(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        monkeypatch.setattr(doom_tick.os, "nice", _deny)
+        raise_tick_priority("nice")
+        assert "could not raise doom-tick priority" in capsys.readouterr().out
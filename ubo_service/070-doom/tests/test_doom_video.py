@@ -0,0 +1,135 @@
+"""
+tests/test_doom_video.py
+
+Unit tests for VideoPipe — the framebuffer -> RGB565 LCD frame conversion.
+
+Needs numpy only (the numba comparison is skipped without numba): no Kivy,
+no .so, no ubo_app imports.  Expected bytes come from rgb565_be(), a scalar
+reference independent of the vectorised packs under test.
+"""
+
+from __future__ import annotations
+
+import ctypes
+
+import numpy as np
+import pytest
+
+from doom_video import ACTIVE_BYTES, ACTIVE_H, OUT_W, PAD_TOP, RGBA_U32, VideoPipe
+
+SRC_W, SRC_H = 320, 200
+
+
+def rgba(r: int, g: int, b: int) -> int:
+    """One Doom RGBA8888 pixel as a RGBA_U32 word (R in the low byte)."""
+    return r | (g << 8) | (b << 16) | (0xFF << 24)
+
+
+def rgb565_be(r: int, g: int, b: int) -> bytes:
+    """Reference RGB565 big-endian encoding: keep the top 5/6/5 bits."""
+    v = ((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)
+    return v.to_bytes(2, "big")
+
+
+@pytest.fixture
+def pipe() -> VideoPipe:
+    return VideoPipe.create(src_w=SRC_W, src_h=SRC_H, backend="numpy")
+
+
+@pytest.fixture
+def frame() -> np.ndarray:
+    return np.full(SRC_W * SRC_H, 0xFF336699, dtype=RGBA_U32)
+
+
+# ------------------------------------------------------------------ #
+# frame_changed / reset
+# ------------------------------------------------------------------ #
+
+class TestFrameChanged:
+    def test_first_frame_is_changed(self, pipe: VideoPipe, frame: np.ndarray) -> None:
+        assert pipe.frame_changed(frame)
+
+    def test_repeated_frame_is_unchanged(self, pipe: VideoPipe, frame: np.ndarray) -> None:
+        pipe.frame_changed(frame)
+        assert not pipe.frame_changed(frame)
+
+    def test_new_content_is_changed(self, pipe: VideoPipe, frame: np.ndarray) -> None:
+        pipe.frame_changed(frame)
+        frame[0] = 0
+        assert pipe.frame_changed(frame)
+
+    def test_restarted_pipe_reports_static_frame_as_changed(
+        self, pipe: VideoPipe, frame: np.ndarray
+    ) -> None:
+        """Regression: after a display restart a static screen must be resent."""
+        pipe.frame_changed(frame)
+        pipe.reset()
+        assert pipe.frame_changed(frame)
+
+
+# ------------------------------------------------------------------ #
+# rgba_to_rgb565_be
+# ------------------------------------------------------------------ #
+
+# (r, g, b) -> hand-computed big-endian RGB565 bytes.
+PIXEL_CASES = [
+    pytest.param((255, 0, 0), b"\xf8\x00", id="red"),
+    pytest.param((0, 255, 0), b"\x07\xe0", id="green"),
+    pytest.param((0, 0, 255), b"\x00\x1f", id="blue"),
+    pytest.param((255, 255, 255), b"\xff\xff", id="white"),
+    pytest.param((0, 0, 0), b"\x00\x00", id="black"),
+    # 0x87 = 1000_0111: R/B keep 10000, G keeps 100001 -> 0x8430.
+    pytest.param((0x87, 0x87, 0x87), b"\x84\x30", id="grey_truncation"),
+]
+
+
+class TestRgbaToRgb565Be:
+    @pytest.mark.parametrize("rgb,expected", PIXEL_CASES)
+    def test_solid_frame_packs_to_known_bytes(
+        self, pipe: VideoPipe, rgb: tuple[int, int, int], expected: bytes
+    ) -> None:
+        assert rgb565_be(*rgb) == expected  # reference agrees with the hand values
+        src = np.full(SRC_W * SRC_H, rgba(*rgb), dtype=RGBA_U32)
+        assert pipe.rgba_to_rgb565_be(src) == expected * (OUT_W * ACTIVE_H)
+
+    def test_returns_active_rows_only(self, pipe: VideoPipe, frame: np.ndarray) -> None:
+        out = pipe.rgba_to_rgb565_be(frame)
+        assert len(out) == ACTIVE_BYTES.stop - ACTIVE_BYTES.start == 72_000
+
+    def test_rows_come_out_in_order(self, pipe: VideoPipe) -> None:
+        # A different colour per source row; output row y samples source row
+        # y * SRC_H // ACTIVE_H (nearest neighbour).
+        colours = [(r, 255 - r, r // 2) for r in range(SRC_H)]
+        src = np.repeat(np.array([rgba(*c) for c in colours], dtype=RGBA_U32), SRC_W)
+        out = pipe.rgba_to_rgb565_be(src)
+        row_bytes = OUT_W * 2
+        for y in range(ACTIVE_H):
+            src_row = y * SRC_H // ACTIVE_H
+            expected = rgb565_be(*colours[src_row]) * OUT_W
+            assert out[y * row_bytes:(y + 1) * row_bytes] == expected, y
+
+    def test_letterbox_rows_stay_zero(self, pipe: VideoPipe) -> None:
+        src = np.full(SRC_W * SRC_H, rgba(255, 255, 255), dtype=RGBA_U32)
+        pipe.rgba_to_rgb565_be(src)
+        pipe.rgba_to_rgb565_be(src)
+        pad_bytes = PAD_TOP * OUT_W * 2
+        assert ACTIVE_BYTES.start == pad_bytes
+        assert not pipe.out_bytes[:pad_bytes].any()
+        assert not pipe.out_bytes[ACTIVE_BYTES.stop:].any()
+        assert len(pipe.out_bytes) - ACTIVE_BYTES.stop == pad_bytes
+
+    def test_numba_matches_numpy(self) -> None:
+        pytest.importorskip("numba")
+        # Same layout as production: a writable uint32 view over a ctypes
+        # buffer (the library's framebuffer), not a numpy-owned array.
+        nbytes = SRC_W * SRC_H * 4
+        buf = (ctypes.c_uint8 * nbytes)()
+        ctypes.memmove(buf, np.random.default_rng(0).bytes(nbytes), nbytes)
+        src = np.frombuffer(buf, dtype=RGBA_U32)
+        assert src.flags.writeable
+
+        numpy_pipe = VideoPipe.create(src_w=SRC_W, src_h=SRC_H, backend="numpy")
+        numba_pipe = VideoPipe.create(src_w=SRC_W, src_h=SRC_H, backend="numba")
+        assert numba_pipe.rgba_to_rgb565_be(src) == numpy_pipe.rgba_to_rgb565_be(src)
+        assert not numba_pipe.out_bytes[:ACTIVE_BYTES.start].any()
+        assert not numba_pipe.out_bytes[ACTIVE_BYTES.stop:].any()
@@ -12,14 +12,14 @@ async def setup(register_reducer: ReducerRegistrar) -> None:
 
     register_reducer(reducer)
 
-    import traceback
-
     try:
         from setup import init_service
         print("[doom] calling init_service()", flush=True)
         init_service()
         print("[doom] init_service() completed OK", flush=True)
     except Exception:
+        import traceback
+
         print("[doom] init_service() FAILED:\n" + traceback.format_exc(), flush=True)
 
 